@@ -4,10 +4,37 @@
 # https://tech.people-doc.com/
 #   python-class-based-decorators.html#the-decorator-class
 
+import functools
+
 # Sentinel to detect undefined function argument.
 UNDEFINED_FUNCTION = object()
 
 
+@functools.lru_cache(maxsize=None)
+def _decorated_class(decorator_class: type) -> type:
+    """Builds the "already decorated" variant of a decorator class.
+
+    The variant is a slot-less subclass whose ``__call__`` *is* the class's
+    :py:meth:`Decorator.run`, so calling a decorated instance goes straight to
+    :py:meth:`Decorator.run` without re-checking whether a function has been
+    decorated yet.
+
+    :param decorator_class: The decorator class to build the variant of.
+
+    :return:    The variant class (or the class itself if it already is one).
+    """
+    if getattr(decorator_class, '_is_decorated_class', False):
+        return decorator_class
+
+    return type(decorator_class.__name__,
+                (decorator_class,),
+                {'__slots__': (),
+                 '__module__': decorator_class.__module__,
+                 '__qualname__': decorator_class.__qualname__,
+                 '__call__': decorator_class.run,
+                 '_is_decorated_class': True})
+
+
 class Decorator:
     """Base class to easily create convenient decorators.
 
@@ -32,7 +59,12 @@ class Decorator:
     special implementation in Decorator. Generally, consider overriding
     :py:meth:`run` instead of :py:meth:`__call__`.
 
+    Decorator instances use ``__slots__``; subclasses that need extra instance
+    attributes should declare their own ``__slots__`` for them.
+
     """
+    __slots__ = ('options', 'decorated')
+
     def __init__(self, func=UNDEFINED_FUNCTION, **kwargs):
         """Constructor.
 
@@ -61,6 +93,8 @@ class Decorator:
         if not callable(func):
             raise TypeError(f'Cannot decorate non callable object "{func}"')
         self.decorated = func
+        # Swap in the variant of this class that calls run() directly
+        self.__class__ = _decorated_class(type(self))
         return self
 
     def setup(self, **kwargs):
@@ -69,23 +103,26 @@ class Decorator:
         return self
 
     def __call__(self, *args, **kwargs):
-        """Run decorated function if available, else decorate first arg."""
-        if self.decorated is UNDEFINED_FUNCTION:
-            # This code path is run when we call the class initialization
-            # within the decorator (i.e. the decorator has parentheses)
-            func = args[0]
-            if args[1:] or kwargs:
-                raise ValueError('Cannot decorate and setup simultaneously '
-                                 'with __call__(). Use __init__() or '
-                                 'setup() for setup. Use __call__() or '
-                                 'decorate() to decorate.')
-            self.decorate(func)
-            return self
+        """Decorate first arg, or run decorated function if available.
 
-        # This code path is run when we build the decorator "on the fly,"
-        # because we've already run decorate in init
-        # (i.e. when the decorator doesn't have parentheses)
-        return self.run(*args, **kwargs)
+        Once :py:meth:`decorate` has run, the instance's class is swapped for
+        a variant whose ``__call__`` is :py:meth:`run`, so this method is
+        normally only reached before a function has been decorated.
+        """
+        if self.decorated is not UNDEFINED_FUNCTION:
+            # Only reached if an overridden decorate() skipped the class swap
+            return self.run(*args, **kwargs)
+
+        # This code path is run when we call the class initialization
+        # within the decorator (i.e. the decorator has parentheses)
+        func = args[0]
+        if args[1:] or kwargs:
+            raise ValueError('Cannot decorate and setup simultaneously '
+                             'with __call__(). Use __init__() or '
+                             'setup() for setup. Use __call__() or '
+                             'decorate() to decorate.')
+        self.decorate(func)
+        return self
 
     def run(self, *args, **kwargs):
         """Actually run the decorator.
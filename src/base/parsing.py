@@ -1,36 +1,71 @@
 """A Module for constructing and parsing the dice rolling language."""
-from random import randint
+from random import randint, choices
 from typing import Tuple
 from math import ceil
 
-from sly import Lexer, Parser
+from sly import Parser
+from sly.lex import Token
 
-# pylint: disable=W,C,R,E
-class DiceLexer(Lexer):
-    tokens = {NUMBER, PLUS, MINUS, TIMES, DIVIDE, LEFT_PARENTHESES, RIGHT_PARENTHESES, DIE_ROLL}
-    ignore = ' \t'
-
-    # Tokens
-    NUMBER = r'\d+'
-
-    # Special symbols
-    PLUS = r'\+'
-    MINUS = r'-'
-    TIMES = r'\*'
-    DIVIDE = r'/'
-    LEFT_PARENTHESES = r'\('
-    RIGHT_PARENTHESES = r'\)'
-    DIE_ROLL = r'd'
-
-    # Ignored pattern
-    ignore_newline = r'\n+'
+# The largest die that will be rolled in one batch with `random.choices`
+MAX_BATCHED_DIE_FACES = 2 ** 32
 
-    # Extra action for newlines
-    def ignore_newline(self, t):
-        self.lineno += t.value.count('\n')
-
-    def error(self, t):
-        self.index += 1
+# pylint: disable=W,C,R,E
+class DiceLexer:
+    """A table-driven scanner for the dice language.
+
+    Every token is either a run of digits or a single character, so instead of
+    going through sly's regex master pattern we walk the text once and look
+    each character up directly. Tokens are still yielded as `sly.lex.Token`
+    instances so that `DiceParser` can consume them unchanged.
+    """
+    tokens = {'NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'LEFT_PARENTHESES', 'RIGHT_PARENTHESES', 'DIE_ROLL'}
+
+    # Single character tokens
+    _symbols = {
+        '+': 'PLUS',
+        '-': 'MINUS',
+        '*': 'TIMES',
+        '/': 'DIVIDE',
+        '(': 'LEFT_PARENTHESES',
+        ')': 'RIGHT_PARENTHESES',
+        'd': 'DIE_ROLL',
+    }
+    _digits = frozenset('0123456789')
+    ignore = frozenset(' \t')
+
+    def tokenize(self, text: str, lineno: int = 1, index: int = 0):
+        text_length = len(text)
+        while index < text_length:
+            char = text[index]
+
+            if char in self.ignore:
+                index += 1
+                continue
+            if char == '\n':
+                lineno += 1
+                index += 1
+                continue
+
+            if char in self._digits:
+                end = index + 1
+                while end < text_length and text[end] in self._digits:
+                    end += 1
+                token_type = 'NUMBER'
+            else:
+                token_type = self._symbols.get(char)
+                if token_type is None:
+                    # Unknown character; skip over it
+                    index += 1
+                    continue
+                end = index + 1
+
+            token = Token()
+            token.type = token_type
+            token.value = text[index:end]
+            token.lineno = lineno
+            token.index = index
+            token.end = index = end
+            yield token
 
 # pylint: disable=W,C,R,E
 class DiceParser(Parser):
@@ -48,6 +83,22 @@ class DiceParser(Parser):
         # Used to log all steps for later output
         self.step_log: list = []
 
+    def parse(self, tokens):
+        """Parses the tokens, starting from an empty step log.
+
+        A roll that fails partway through (such as one dividing by zero) never
+        reaches `statement`, so its steps have to be cleared here for the
+        parser to be safely reused.
+
+        :param tokens:  The tokens to parse, as produced by `DiceLexer`.
+
+        :return:    A tuple with a list of the steps and the final value, or
+                    None if the tokens could not be parsed.
+        """
+
+        self.step_log = []
+        return super().parse(tokens)
+
     @_('expr')
     def statement(self, p) -> Tuple[list, float]:
         """Exit point of the expression when everything else is evaluated.
@@ -79,23 +130,26 @@ class DiceParser(Parser):
         else:
             invert_result = False
 
-        roll_total = 0
-        die_values = []
         die_min_value = 1
-        for _ in range(number_of_dice):
-            if die_max_value > 0:
-                # roll between 1 and max value
-                die_value = randint(die_min_value, die_max_value)
-            elif die_max_value < 0:
-                # roll between max value, and -1
-                die_min_value = -1
-                die_value = randint(die_max_value, die_min_value)
-            else:
-                # tf is a d0? just spit back zero.
-                die_value = 0
+        if die_max_value > 0:
+            # roll between 1 and max value
+            die_faces = range(die_min_value, die_max_value + 1)
+        elif die_max_value < 0:
+            # roll between max value, and -1
+            die_min_value = -1
+            die_faces = range(die_max_value, die_min_value + 1)
+        else:
+            # tf is a d0? just spit back zero.
+            die_faces = (0,)
 
-            die_values.append(die_value)
-            roll_total += die_value
+        if len(die_faces) <= MAX_BATCHED_DIE_FACES:
+            # roll every die in a single call rather than one randint per die
+            die_values = choices(die_faces, k=number_of_dice)
+        else:
+            # choices() picks with floating point math, which can't reach every
+            # face of a die this large, so fall back to exact integer rolls
+            die_values = [randint(die_faces[0], die_faces[-1]) for _ in range(number_of_dice)]
+        roll_total = sum(die_values)
 
         step_string = f'{number_of_dice}d{die_max_value}={roll_total}('
         crit_success_count = 0
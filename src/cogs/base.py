@@ -1,6 +1,10 @@
 """A Module for base Cog functionality."""
+import atexit
+import functools
 import json
 import logging
+import logging.handlers
+import queue
 from typing import Optional, Union
 
 from discord import Role, Guild, Member
@@ -29,6 +33,10 @@ def build_logger(enable_debug: bool) -> logging.Logger:
 
     # Create logger management class
     logger = logging.getLogger('main logger')
+    if logger.handlers:
+        # Already built; adding the handlers again would write every message
+        # out once per extra handler
+        return logger
     logger.setLevel(logger_base_level)
 
     # Create file logger
@@ -42,9 +50,18 @@ def build_logger(enable_debug: bool) -> logging.Logger:
     console_logger.setLevel(logging.WARNING)
     console_logger.setFormatter(formatter)
 
-    # Add the handlers to the logger
-    logger.addHandler(file_logger)
-    logger.addHandler(console_logger)
+    # Route records through a queue so that the handlers (and their file and
+    # console I/O) run on a background thread instead of in the bot's event
+    # loop
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue,
+                                              file_logger,
+                                              console_logger,
+                                              respect_handler_level=True)
+    listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(listener.stop)
 
     return logger
 
@@ -52,6 +69,10 @@ def build_logger(enable_debug: bool) -> logging.Logger:
 def load_config(filename: str) -> dict:
     """Loads the specified json config file into memory for usage.
 
+    The file is only parsed the first time a given filename is requested;
+    later calls return the same dictionary, so callers must not mutate it.
+    Call `_load_config.cache_clear()` to force a re-read.
+
     :param filename:    A valid path and filename from which the json
                         configuration will be loaded.
 
@@ -60,13 +81,30 @@ def load_config(filename: str) -> dict:
     :except ValueError: if the filename is empty or not a valid string.
     """
 
-    if filename is None or filename == '' or not isinstance(filename, str):
+    # Checked before the cache is consulted, since the cache would raise a
+    # TypeError of its own for a filename that can't be hashed
+    if not filename or not isinstance(filename, str):
         raise ValueError('filename must be a valid, non-empty string.')
 
-    with open(filename, encoding='utf-8') as config_file:
+    return _load_config(filename)
+
+
+@functools.cache
+def _load_config(filename: str) -> dict:
+    """Parses a json config file, caching the result by filename.
+
+    :param filename:    A valid path and filename from which the json
+                        configuration will be loaded.
+
+    :return:    A dictionary parsed directly from the JSON file.
+    """
+
+    # Hand the raw bytes straight to the decoder rather than decoding the
+    # whole file to text first
+    with open(filename, 'rb') as config_file:
         json_dict = json.load(config_file)
 
-    return dict(json_dict)
+    return json_dict
 
 
 def is_cog_enabled(cog_name: str, config_dict: dict) -> Optional[bool]:
@@ -112,6 +150,9 @@ class ConfiguredCog(commands.Cog):
     logger: logging.Logger = build_logger(config['verbose_logging'])
     config_name: str
 
+    # Role name to role lookups for each guild, keyed by the guild's ID
+    _role_index: dict[int, dict[str, Role]] = {}
+
     def __init__(self, bot: commands.Bot):
         """Initializes the Base class for usage
 
@@ -122,15 +163,17 @@ class ConfiguredCog(commands.Cog):
         self.bot: commands.Bot = bot
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def convert_color(color_code: Union[str, None]) -> Union[int, str, None]:
         """A static method used for processing serialized hex codes into
-        integers.
+        integers. Results are cached per color code.
 
         :param color_code: A hex code to parse or `None`.
 
         :return:    If the hex code is a string that is 4 or 7 characters long
                     (with the first character being a #), it will return that
-                    as an integer. If the hex code does not meet the
+                    as an integer, expanding shorthand codes (`#abc` is read
+                    as `#aabbcc`). If the hex code does not meet the
                     conditionals above, it will return the argument as passed
                     in.
         """
@@ -141,6 +184,10 @@ class ConfiguredCog(commands.Cog):
 
         # Crop out the hashtag at the start
         color_code = color_code[1:]
+        if len(color_code) == 3:
+            # Shorthand code; each digit stands for a doubled pair
+            color_code = ''.join(digit * 2 for digit in color_code)
+
         return int(color_code, 16)
 
     def is_cog_enabled(self, cog_name: str) -> Optional[bool]:
@@ -155,8 +202,9 @@ class ConfiguredCog(commands.Cog):
         """
         return is_cog_enabled(cog_name, self.config)
 
-    @staticmethod
-    def find_role_in_guild(role_name_query: str,
+    @classmethod
+    def find_role_in_guild(cls,
+                           role_name_query: str,
                            guild: Guild) -> Optional[Role]:
         """Finds a role with the provided name in a guild.
 
@@ -164,33 +212,64 @@ class ConfiguredCog(commands.Cog):
         provided name. Be careful if the guild has multiple roles with the same
         role name. Also keep in mind that the role search *is* case-sensitive.
 
+        Lookups go through a per-guild index of role names. An indexed role is
+        only trusted if it still exists in the guild under the same name;
+        otherwise (or if the name isn't indexed at all) the index is rebuilt
+        from the guild's current roles.
+
         :param role_name_query: The name of the role to search the guild for.
         :param guild:           The guild to validate the role name against.
 
         :return:    Returns the role in the class, or None if no role exists in
                     the guild.
         """
-        for role in guild.roles:
-            if role.name == role_name_query:
+        role_index = cls._role_index.get(guild.id)
+        if role_index is not None:
+            role = role_index.get(role_name_query)
+            if (role is not None and role.name == role_name_query and
+                    guild.get_role(role.id) is role):
                 # found the role with the provided name
                 return role
 
-        # didn't find the role
-        return None
+        # The index is missing or out of date, so rebuild it
+        return cls._build_role_index(guild).get(role_name_query)
+
+    @classmethod
+    def _build_role_index(cls, guild: Guild) -> dict[str, Role]:
+        """Builds (or rebuilds) the role name lookup for the provided guild.
+
+        :param guild:   The guild to index the roles of.
+
+        :return:    A dictionary where the key is the role name and the value
+                    is the first (lowest) role in the guild with that name.
+        """
+        role_index = {}
+        for role in guild.roles:
+            # guild.roles is ordered lowest first, so keep the first match
+            role_index.setdefault(role.name, role)
+
+        cls._role_index[guild.id] = role_index
+        return role_index
+
+    @classmethod
+    def invalidate_role_index(cls, guild: Guild):
+        """Drops the role name lookup for the provided guild, so that it's
+        rebuilt on the next lookup.
+
+        :param guild:   The guild whose roles changed.
+        """
+        cls._role_index.pop(guild.id, None)
 
     @staticmethod
-    def member_contains_role(role_name_query: str, member: Member) -> bool:
-        """Validates that the provided member has a role with the given name.
+    def member_contains_role(role: Role, member: Member) -> bool:
+        """Validates that the provided member has the given role.
 
-        :param role_name_query: The name of the role to search the guild for.
-        :param member:          The guild to validate the role name against.
+        The role is matched by its unique ID, through the member's sorted list
+        of role IDs, rather than by comparing the name of each of their roles.
+
+        :param role:    The role to look for.
+        :param member:  The member to validate the role against.
 
         :return:    True if the member contains the role, or False otherwise.
         """
-        for role in member.roles:
-            if role.name == role_name_query:
-                # found the role with the provided name
-                return True
-
-        # didn't find the role
-        return False
+        return member.get_role(role.id) is not None
@@ -1,13 +1,40 @@
 """A module for tools intended for general server management."""
+import asyncio
 from enum import Enum
 from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Optional
 
 from discord import Member
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from src.cogs.base import ConfiguredCog
 from src.data import data_access
 
+# The replies to the warn command, formatted with the user query and their
+# warning count
+WARNED_MESSAGE = ('The user "{user}" has now been warned, for a total of '
+                  '{count} times.')
+UNWARNED_MESSAGE = ('The user "{user}" has now been unwarned, they now have '
+                    '{count} warnings.')
+VIEW_MESSAGE = 'The user "{user}" has {count} warnings.'
+NOT_FOUND_MESSAGE = ('No user by the name or id of `{user}` could be found. '
+                     'Please check your spelling and try again.')
+UNKNOWN_ACTION_MESSAGE = ('Unknown warning command `{action}`, please '
+                          're-enter your command and try again.')
+NO_USERS_MESSAGE = ('Please name at least one user, by their name or id, and '
+                    'try again.')
+
+# The text wrapped around the list of members when a query matches several
+MULTIPLE_FOUND_HEADER = ('Multiple users by the identifier "{query}" were '
+                         'found. Displaying as\n *<display name>* '
+                         '(*<account name>*), **id:** *<id>*:\n\n')
+MULTIPLE_FOUND_FOOTER = ('\n\nPlease try again, using the unique id for the '
+                         'user you wish to warn.')
+
+# The most characters discord allows in a single message
+MESSAGE_CHARACTER_LIMIT = 2000
+
 
 class WarnAction(Enum):
     """An enumeration class containing all the possible warning actions that
@@ -24,6 +51,39 @@ class UserWarnCog(ConfiguredCog):
 
     config_name = 'warn'
 
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog, its action handlers and its member name index.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The config is only loaded once, so hold onto the warning duration
+        self._warning_duration: int = self.config['warning_duration_days']
+
+        # The method that carries out each action on the target members and
+        # returns their new warning counts, paired with the reply template.
+        # Keyed by the action's command string, so a command is dispatched
+        # with a single lookup and no WarnAction has to be built for it.
+        self._action_handlers: dict[str, tuple[Callable, str]] = {
+            WarnAction.APPLY.value: (self._warn_members, WARNED_MESSAGE),
+            WarnAction.RESOLVE.value: (
+                partial(self._remove_warnings, action=WarnAction.RESOLVE),
+                UNWARNED_MESSAGE),
+            WarnAction.UNDO.value: (
+                partial(self._remove_warnings, action=WarnAction.UNDO),
+                UNWARNED_MESSAGE),
+            WarnAction.VIEW.value: (self._view_user_warnings, VIEW_MESSAGE),
+        }
+
+        # Members keyed by their casefolded display names, nicknames and
+        # account names, and then by their guild and user ids. It's built on
+        # first use and kept current by the member listeners.
+        self._member_name_index: Optional[dict[str, dict[tuple, Member]]] = \
+            None
+
     @commands.command()
     @commands.has_any_role(*ConfiguredCog.config['mod_roles'])
     async def warn(self,
@@ -36,164 +96,166 @@ class UserWarnCog(ConfiguredCog):
                                 to an action in the `WarnAction` enumeration.
         :param user_name_list:  A list of strings, denoting either a user's
                                 nickname, or their discord ID. This list will
-                                be joined by spaces and compared against the
-                                server's member list, first by trying to
-                                convert it to an integer and searching by
-                                unique ID, then by querying the list of
-                                nicknames by the joined string.
+                                be joined by spaces and split on commas, so
+                                several users can be targeted at once (so a
+                                user whose name has a comma in it can only be
+                                targeted by their ID). Each query is compared
+                                against the server's member list, first by
+                                trying to convert it to an integer and
+                                searching by unique ID, then by querying the
+                                list of nicknames by the query.
         """
 
         # join all the arguments after the action together,
         # in case we are looking for a display name that has a space
-        user_name_query = ' '.join(user_name_list)
-        action = action.lower()
-
-        # Finds all the members that match the query
-        # (either a discord ID or a display name)
-        member_matches = self._find_discord_member(user_name_query)
-
-        if not member_matches:
-            await ctx.send(f'No user by the name or id of `{user_name_query}` '
-                           f'could be found. Please check your spelling and '
-                           f'try again.')
-
-        elif len(member_matches) > 1:
-            await ctx.send(self._multi_member_found_message(user_name_query,
-                                                            member_matches))
+        # (skipping the empty queries left by stray commas)
+        user_name_queries = [user_name_query.strip()
+                             for user_name_query
+                             in ' '.join(user_name_list).split(',')
+                             if user_name_query.strip()]
+        if not user_name_queries:
+            await ctx.send(NO_USERS_MESSAGE)
+            return
 
-        else:
-            target_member = member_matches[0]
-
-            # remove outdated warnings for the found user
-            self._remove_outdated_warnings(target_member)
-
-            if action == WarnAction.APPLY.value:
-                warning_count = self._warn_member(target_member)
-                message = (f'The user "{user_name_query}" has now been '
-                           f'warned, for a total of {warning_count} times.')
-            elif action in (WarnAction.RESOLVE.value, WarnAction.UNDO.value):
-                warning_count = self._remove_warning(target_member, action)
-                message = (f'The user "{user_name_query}" has now '
-                           f'been unwarned, they now have {warning_count} '
-                           f'warnings.')
-            elif action == WarnAction.VIEW.value:
-                warning_count = self._view_user_warnings(target_member)
-                message = (f'The user "{user_name_query}" has {warning_count} '
-                           f'warnings.')
+        action_handler = self._action_handlers.get(action.lower())
+
+        messages = []
+        # The member each query found, keyed by the member's ID so that a
+        # member named twice is only acted on once
+        target_members = {}
+        for user_name_query in user_name_queries:
+            # Finds all the members that match the query
+            # (either a discord ID or a display name)
+            member_matches = self._find_discord_member(user_name_query)
+
+            if not member_matches:
+                messages.append(NOT_FOUND_MESSAGE.format(user=user_name_query))
+            elif len(member_matches) > 1:
+                messages.append(self._multi_member_found_message(
+                    user_name_query, member_matches))
             else:
-                message = (f'Unknown warning command `{action}`, '
-                           f'please re-enter your command and try again.')
+                target_members.setdefault(member_matches[0].id,
+                                          (user_name_query, member_matches[0]))
 
-            await ctx.send(message)
+        if target_members:
+            if action_handler is None:
+                messages.append(UNKNOWN_ACTION_MESSAGE.format(action=action))
+            else:
+                handler, message_template = action_handler
+                # Act on every target at once, on a worker thread so that the
+                # database calls don't hold up the bot's event loop
+                warning_counts = await asyncio.to_thread(
+                    handler, [target_member for _, target_member
+                              in target_members.values()])
+                messages.extend(
+                    message_template.format(user=user_name_query,
+                                            count=warning_count)
+                    for (user_name_query, _), warning_count
+                    in zip(target_members.values(), warning_counts))
+
+        # Several users can make for a long reply, so send it in as many
+        # messages as discord needs
+        for message_chunk in self._split_message(messages):
+            await ctx.send(message_chunk)
+
+    @tasks.loop(hours=1)
+    async def _expire_warnings(self):
+        """A looping task that deletes every warning older than the configured
+        warning duration, so that commands don't have to clean up first.
+        """
 
-    def _remove_outdated_warnings(self, target_member: Member):
-        """Queries the database for warnings pertaining to the specified member
-        and deletes ones that are outdated.
+        warning_max_date = (datetime.now() -
+                            timedelta(days=self._warning_duration))
 
-        :param target_member:   The member to look for when removing outdated
-                                warnings.
-        """
+        deleted_count = await asyncio.to_thread(
+            data_access.delete_warnings_older_than, warning_max_date)
+        if deleted_count:
+            self.logger.debug('Deleted %s outdated warnings.', deleted_count)
 
-        warning_duration = self.config['warning_duration_days']
+    async def cog_load(self):
+        """Overridden from commands.Cog; starts the automated task."""
 
-        if warning_duration <= 0:
+        if self._warning_duration <= 0:
             # If duration set in the config is zero or less,
             # we assume warnings are permanent.
             return
 
-        member_id = target_member.id
-        user_warnings = data_access.lookup_warnings_by_discord_id(member_id)
+        # pylint: disable-msg=E1101
+        self._expire_warnings.start()
 
-        for warning in user_warnings:
-            warning_max_date = (datetime.now() -
-                                timedelta(days=warning_duration))
-            if (warning is not None and
-                    warning_max_date > warning.Warning_Stamp):
-                data_access.delete_warning(warning.Warning_Id)
+    async def cog_unload(self):
+        """Overridden from commands.Cog; stops the automated task."""
+
+        # pylint: disable-msg=E1101
+        self._expire_warnings.cancel()
 
     @staticmethod
-    def _warn_member(target_member: Member) -> int:
-        """Saves a new warning in the database for the member specified.
+    def _warn_members(target_members: list) -> list:
+        """Saves a new warning in the database for each of the members
+        specified, all at once.
 
-        Please note that this method will add a member row to the database if
-        it cannot find one, before continuing onwards to add a warning to that
-        member.
+        Please note that this method will add a member row to the database for
+        any member it cannot find one for, before continuing onwards to add a
+        warning to that member.
 
-        :param target_member:   The member to add a warning to.
+        :param target_members:  The members to add a warning to.
 
-        :return:    The number of total warnings assigned to the member.
+        :return:    The number of total warnings assigned to each member, in
+                    the same order as the members.
         """
 
-        target_id = target_member.id
-        user_warnings = data_access.lookup_warnings_by_discord_id(target_id)
-        warning_count = user_warnings.count()
-
-        # Find the user in the db so that we can attach a warning to it
-        # (should add a user if none found)
-        db_user_id = data_access.find_user_id_by_discord_id(target_member.id)
+        warning_counts = data_access.add_warnings_by_discord_ids(
+            [target_member.id for target_member in target_members])
 
-        # Add the new warning
-        data_access.add_warning(db_user_id)
-        warning_count += 1
-
-        return warning_count
+        return [warning_counts[target_member.id]
+                for target_member in target_members]
 
     @staticmethod
-    def _remove_warning(target_member: Member, action: str) -> int:
-        """Deletes a warning in the database for the member specified.
+    def _remove_warnings(target_members: list, action: WarnAction) -> list:
+        """Deletes a warning in the database for each of the members
+        specified.
 
-        :param target_member:   The member to add a warning to.
+        :param target_members:  The members to remove a warning from.
         :param action:          The action to perform. MUST be either
                                 `WarnAction.RESOLVE` or `WarnAction.UNDO`.
 
-        :return:    The number of total warnings assigned to the member.
+        :return:    The number of total warnings assigned to each member, in
+                    the same order as the members.
 
-        :except ValueError: When the action argument is not a valid string.
+        :except ValueError: When the action argument is not a removal action.
         """
 
-        target_id = target_member.id
-        user_warnings = data_access.lookup_warnings_by_discord_id(target_id)
-        warning_count = user_warnings.count()
-
-        if warning_count == 0:
-            # no warnings, so nothing to remove.
-            return warning_count
-
-        if action == WarnAction.RESOLVE.value:
+        if action is WarnAction.RESOLVE:
             # Remove the oldest index
             delete_newest = False
-        elif action == WarnAction.UNDO.value:
+        elif action is WarnAction.UNDO:
             # Remove the newest index
             delete_newest = True
         else:
             raise ValueError('The action argument must be a valid removal '
                              'WarnAction.')
 
-        data_access.delete_warning_by_discord_id(target_member.id,
-                                                delete_newest)
-        warning_count -= 1
-
-        return warning_count
+        # Members without any warnings are left as they are
+        return [data_access.delete_warning_by_discord_id(target_member.id,
+                                                        delete_newest)
+                for target_member in target_members]
 
     @staticmethod
-    def _view_user_warnings(target_member: Member) -> int:
-        """Finds the number of warnings in the database for the member
-        specified.
+    def _view_user_warnings(target_members: list) -> list:
+        """Finds the number of warnings in the database for each of the
+        members specified.
 
-        :param target_member:   The member to add a warning to.
+        :param target_members:  The members to count the warnings of.
 
-        :return:    The number of total warnings assigned to the member.
+        :return:    The number of total warnings assigned to each member, in
+                    the same order as the members.
         """
 
-        target_id = target_member.id
-        warning_rows = data_access.lookup_warnings_by_discord_id(target_id)
+        warning_counts = data_access.count_warnings_by_discord_ids(
+            [target_member.id for target_member in target_members])
 
-        if warning_rows.first() is None:
-            count = 0
-        else:
-            count = warning_rows.count()
-
-        return count
+        return [warning_counts.get(target_member.id, 0)
+                for target_member in target_members]
 
     def _find_discord_member(self, user_query: str) -> list:
         """Finds the discord information for the users matching the provided
@@ -201,9 +263,10 @@ class UserWarnCog(ConfiguredCog):
 
         This method will attempt to convert the query into an integer and grab
         the user via the id first. If that fails, it will take the raw string
-        provided and attempt to find all users with the matching nickname. In
-        the event that it finds more than member that matches the query, it
-        will return all of them.
+        provided and attempt to find all users with the matching nickname in
+        the member name index, which the cog's listeners keep current. In the
+        event that it finds more than member that matches the query, it will
+        return all of them.
 
         :param user_query:  The query to search for, either an integer discord
                             ID or a member nickname.
@@ -212,36 +275,125 @@ class UserWarnCog(ConfiguredCog):
                     a member that matched the query, or an empty list, if no
                     matches were found.
         """
-        member_matches = []
-
         # try to lookup by ID first, as it'll be faster
-        try:
-            member_matches.append(self.bot.get_user(int(user_query)))
-        except ValueError:
-            # couldn't cast the user to an integer,
-            # so ignore that type of error.
-            pass
+        if user_query.isdecimal():
+            user = self.bot.get_user(int(user_query))
+            if user is not None:
+                return [user]
 
         # couldn't find by ID, attempt to look up by display name
-        if not member_matches:
-            member_matches = []
-            for member in self.bot.get_all_members():
-                member_already_in_match_list = False
-                if (member.display_name.upper() == user_query.upper() or
-                        (member.nick is not None and
-                         member.nick.upper() == user_query.upper()) or
-                        member.name.upper() == user_query.upper()):
-                    # Only add a member if the ID (which is unique to a discord
-                    # user) isn't already in the list
-                    for member_match in member_matches:
-                        if member.id == member_match.id:
-                            member_already_in_match_list = True
-                            break
-                    if not member_already_in_match_list:
-                        member_matches.append(member)
+        if self._member_name_index is None:
+            self._build_member_name_index()
+
+        name_matches = self._member_name_index.get(user_query.casefold())
+        if not name_matches:
+            # Nobody goes by that name
+            return []
+
+        # Only keep one member per discord user (which can be in several
+        # guilds), keyed by the user's unique ID
+        member_matches = list({member.id: member
+                               for member in name_matches.values()}
+                              .values())
 
         return member_matches
 
+    def _build_member_name_index(self):
+        """Builds the member name index from every member the bot can see."""
+
+        self._member_name_index = {}
+        for member in self.bot.get_all_members():
+            self._index_member(member)
+
+    @staticmethod
+    def _member_name_keys(member: Member) -> set:
+        """Gets the keys a member can be found by in the member name index.
+
+        :param member:  The member to get the keys of.
+
+        :return:    A set of the member's casefolded display name, nickname
+                    (if they have one) and account name.
+        """
+
+        name_keys = {member.display_name.casefold(),
+                     member.name.casefold()}
+        if member.nick is not None:
+            name_keys.add(member.nick.casefold())
+
+        return name_keys
+
+    def _index_member(self, member: Member):
+        """Adds a member to the member name index under each of their names.
+
+        :param member:  The member to add.
+        """
+
+        member_key = (member.guild.id, member.id)
+        for name_key in self._member_name_keys(member):
+            self._member_name_index.setdefault(name_key, {})[member_key] = \
+                member
+
+    def _unindex_member(self, member: Member):
+        """Removes a member from the member name index.
+
+        :param member:  The member to remove, as it was last indexed.
+        """
+
+        member_key = (member.guild.id, member.id)
+        for name_key in self._member_name_keys(member):
+            name_matches = self._member_name_index.get(name_key)
+            if name_matches is not None:
+                name_matches.pop(member_key, None)
+                if not name_matches:
+                    del self._member_name_index[name_key]
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: Member):
+        """Adds new members to the member name index.
+
+        :param member:  The member that joined.
+        """
+
+        if self._member_name_index is not None:
+            self._index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: Member):
+        """Removes departed members from the member name index.
+
+        :param member:  The member that left.
+        """
+
+        if self._member_name_index is not None:
+            self._unindex_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: Member, after: Member):
+        """Reindexes members whose nickname may have changed.
+
+        :param before:  The member before the update.
+        :param after:   The member after the update.
+        """
+
+        if self._member_name_index is not None:
+            self._unindex_member(before)
+            self._index_member(after)
+
+    @commands.Cog.listener('on_user_update')
+    @commands.Cog.listener('on_guild_join')
+    @commands.Cog.listener('on_guild_remove')
+    @commands.Cog.listener('on_guild_available')
+    @commands.Cog.listener('on_guild_unavailable')
+    @commands.Cog.listener('on_ready')
+    async def _invalidate_member_name_index(self, *_args):
+        """Drops the member name index when account names change or whole
+        guilds of members come and go, so it's rebuilt on next use.
+
+        :param _args:   The event's arguments, which aren't needed.
+        """
+
+        self._member_name_index = None
+
     @staticmethod
     def _multi_member_found_message(user_search_query: str,
                                     member_matches: list) -> str:
@@ -258,19 +410,51 @@ class UserWarnCog(ConfiguredCog):
                     found with the given error message.
         """
 
-        multiple_found_message = (f'Multiple users by the identifier '
-                                  f'"{user_search_query}" were found. '
-                                  f'Displaying as\n *<display name>* '
-                                  f'(*<account name>*), **id:** *<id>*:\n\n')
+        member_lines = [f'- {member.display_name} ({member.name}), '
+                        f'**id:** {member.id}'
+                        for member in member_matches]
 
-        for member in member_matches:
-            uid = member.id
-            name = member.name
-            display_name = member.display_name
-            name_message = f'- {display_name} ({name}), **id:** {uid}\n'
-            multiple_found_message += name_message
+        return (MULTIPLE_FOUND_HEADER.format(query=user_search_query) +
+                '\n'.join(member_lines) +
+                MULTIPLE_FOUND_FOOTER)
+
+    @staticmethod
+    def _split_message(messages: list) -> list:
+        """Joins the messages into as few discord messages as possible, each
+        within discord's character limit.
+
+        Messages are split between lines where they can be, and any single
+        line too long to fit is split wherever the limit falls.
+
+        :param messages:    The strings to send, one after another on
+                            separate lines.
+
+        :return:    The text to send, as a list of strings that each fit in a
+                    single discord message.
+        """
+
+        chunks = []
+        current_chunk = ''
+        for line in '\n'.join(messages).split('\n'):
+            # Break up any line that couldn't fit in a message on its own
+            while len(line) > MESSAGE_CHARACTER_LIMIT:
+                if current_chunk:
+                    chunks.append(current_chunk)
+                    current_chunk = ''
+                chunks.append(line[:MESSAGE_CHARACTER_LIMIT])
+                line = line[MESSAGE_CHARACTER_LIMIT:]
+
+            if not current_chunk:
+                current_chunk = line
+            elif (len(current_chunk) + 1 + len(line) <=
+                  MESSAGE_CHARACTER_LIMIT):
+                current_chunk += '\n' + line
+            else:
+                chunks.append(current_chunk)
+                current_chunk = line
 
-        multiple_found_message += ('\nPlease try again, using the unique id '
-                                   'for the user you wish to warn.')
+        # Discord rejects empty messages, so only keep a chunk with text in it
+        if current_chunk.strip():
+            chunks.append(current_chunk)
 
-        return multiple_found_message
+        return chunks
@@ -1,11 +1,17 @@
 """A module for cogs that manage system-wide processes."""
-import datetime
+import asyncio
 import json
+import os
 import traceback
-from typing import Union
+from bisect import bisect_left
+from datetime import timedelta
+from math import ceil
+from typing import Optional, Union
 
-from discord.ext import commands
-from discord import Message, Embed, Reaction, ClientUser
+from discord.ext import commands, tasks
+from discord import (ui, utils, ButtonStyle, Embed, Forbidden,
+                     HTTPException, Interaction, Member, Message, NotFound,
+                     Object, TextChannel, User)
 
 from src.cogs.base import ConfiguredCog
 
@@ -69,6 +75,39 @@ class AirlockCog(ConfiguredCog):
 
     config_name = 'airlock'
 
+    # How long a message stays in the airlock channel before it's deleted
+    _delete_delay = timedelta(seconds=5)
+    # How many times in a row a purge may fail before the channel is dropped
+    _max_purge_attempts = 5
+    # Discord only bulk deletes messages less than two weeks old (with a
+    # minute of leeway here), so older ones are deleted one at a time
+    _bulk_delete_max_age = timedelta(days=14) - timedelta(minutes=1)
+    # The most messages discord will delete in one bulk delete
+    _bulk_delete_max_count = 100
+
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog, its settings and its record of messages
+        awaiting deletion.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The airlock settings; the config is only loaded once
+        self._airlock_channel_name: str = (
+            self.config['content']['airlock_channel'])
+        self._release_role_name: str = (
+            self.config['content']['airlock_release_role'])
+
+        # Airlock channels with messages waiting to be deleted, keyed by the
+        # channel ID, along with the IDs of those messages in the order they
+        # arrived
+        self._pending_deletes: dict[int, tuple[TextChannel, list[int]]] = {}
+        # The number of failed purges in a row, keyed by the channel ID
+        self._purge_failures: dict[int, int] = {}
+
     @commands.command()
     async def accept(self, ctx: commands.context):
         """The origin point for the accept command
@@ -78,7 +117,7 @@ class AirlockCog(ConfiguredCog):
 
         # Check to make sure the command comes from a predefined channel.
         # If it doesn't, the command fails silently.
-        airlock_channel = ConfiguredCog.config['content']['airlock_channel']
+        airlock_channel = self._airlock_channel_name
         if ctx.guild is None or ctx.channel.name != airlock_channel:
             self.logger.debug('Airlock release command was attempted to be '
                               'called from an invalid location.')
@@ -87,8 +126,7 @@ class AirlockCog(ConfiguredCog):
             return
 
         # Give the message sender a predefined role
-        role_name = ConfiguredCog.config['content']['airlock_release_role']
-        role = self.find_role_in_guild(role_name, ctx.guild)
+        role = self.find_role_in_guild(self._release_role_name, ctx.guild)
         if not role:
             self.logger.error('Encountered an issue attempting to resolve the '
                               'airlock role specified in the config.')
@@ -96,7 +134,7 @@ class AirlockCog(ConfiguredCog):
                            'the sender.')
             return
 
-        if self.member_contains_role(role.name, ctx.author):
+        if self.member_contains_role(role, ctx.author):
             self.logger.warning('%s requested an airlock release when they '
                                 'already had the role.', ctx.author.name)
             await ctx.send('You already have the airlock release role.')
@@ -108,29 +146,239 @@ class AirlockCog(ConfiguredCog):
 
     @commands.Cog.listener()
     async def on_message(self, message: Message):
-        """Watches for any messages sent in the airlock channel, and deletes
-        them after five seconds.
+        """Watches for any messages sent in the airlock channel, and marks
+        them for deletion after five seconds.
 
            :param message:  The message that was sent in a place that the bot
                             can see.
            """
-        airlock_channel = ConfiguredCog.config['content']['airlock_channel']
-        airlock_channel_delete_delay = 5.0  # delay in seconds
-
         if (message.guild is not None and
-                message.channel.name == airlock_channel):
-            # delete any messages coming into the airlock channel
-            self.logger.debug('Deleting a message in the airlock channel.')
-            await message.delete(delay=airlock_channel_delete_delay)
+                message.channel.name == self._airlock_channel_name):
+            # delete any messages coming into the airlock channel, in bulk
+            # from the purge task
+            self.logger.debug('Marking a message in the airlock channel for '
+                              'deletion.')
+            _, message_ids = self._pending_deletes.setdefault(
+                message.channel.id, (message.channel, []))
+            message_ids.append(message.id)
+
+    @tasks.loop(seconds=5)
+    async def _purge_airlock(self):
+        """A looping task that deletes the airlock messages that have been up
+        for at least five seconds, with one bulk delete per hundred messages
+        rather than one request per message.
+
+        Only messages that were seen arriving are deleted, so anything posted
+        while the bot was away is left alone.
+        """
+
+        # Message IDs are ordered by creation time, so any ID below this one
+        # belongs to a message old enough to delete
+        cutoff_id = utils.time_snowflake(utils.utcnow() - self._delete_delay)
+        for channel_id, (channel, message_ids) in list(
+                self._pending_deletes.items()):
+            try:
+                await self._delete_airlock_messages(
+                    channel, message_ids,
+                    bisect_left(message_ids, cutoff_id))
+            except (Forbidden, NotFound) as exception:
+                # Retrying can't help, so stop tracking the channel
+                self.logger.error('Failed to purge the airlock channel, '
+                                  'giving up on it: %s', exception)
+                del self._pending_deletes[channel_id]
+                self._purge_failures.pop(channel_id, None)
+                continue
+            except HTTPException as exception:
+                failures = self._purge_failures.get(channel_id, 0) + 1
+                if failures >= self._max_purge_attempts:
+                    self.logger.error('Failed to purge the airlock channel '
+                                      '%d times, giving up on it: %s',
+                                      failures, exception)
+                    del self._pending_deletes[channel_id]
+                    self._purge_failures.pop(channel_id, None)
+                else:
+                    self.logger.error('Failed to purge the airlock channel: '
+                                      '%s', exception)
+                    self._purge_failures[channel_id] = failures
+                continue
+
+            self._purge_failures.pop(channel_id, None)
+
+            # Messages may have arrived while deleting, so only forget the
+            # channel if nothing is left waiting in it
+            if not message_ids:
+                del self._pending_deletes[channel_id]
+
+    async def _delete_airlock_messages(self, channel: TextChannel,
+                                       message_ids: list, due_count: int):
+        """Deletes the oldest of the marked messages in an airlock channel,
+        removing each batch from the marked messages once it's deleted.
+
+        :param channel:     The airlock channel to delete messages from.
+        :param message_ids: The IDs of the messages marked for deletion in
+                            the channel, oldest first.
+        :param due_count:   How many of the marked messages to delete.
+
+        :except HTTPException:  When discord refuses a deletion; any batches
+                                deleted before then are still removed.
+        """
+
+        bulk_cutoff_id = utils.time_snowflake(
+            utils.utcnow() - self._bulk_delete_max_age)
+        while due_count > 0:
+            if message_ids[0] < bulk_cutoff_id:
+                # Too old to bulk delete, so delete it on its own
+                batch = message_ids[:1]
+            else:
+                # Everything after the first message is newer, so the whole
+                # batch can be bulk deleted
+                batch = message_ids[:min(due_count,
+                                         self._bulk_delete_max_count)]
+
+            if len(batch) == 1:
+                try:
+                    await channel.get_partial_message(batch[0]).delete()
+                except NotFound:
+                    # Someone else already deleted it
+                    pass
+            else:
+                await channel.delete_messages(
+                    [Object(id=message_id) for message_id in batch])
+
+            del message_ids[:len(batch)]
+            due_count -= len(batch)
+
+    async def cog_load(self):
+        """Overridden from commands.Cog; starts the automated task."""
+
+        # pylint: disable-msg=E1101
+        self._purge_airlock.start()
+
+    async def cog_unload(self):
+        """Overridden from commands.Cog; stops the automated task."""
+
+        # pylint: disable-msg=E1101
+        self._purge_airlock.cancel()
+
+
+class HelpPaginationView(ui.View):
+    """A view holding the buttons used to flip between help pages.
+
+    Discord sends button presses straight to the callbacks, so no task has to
+    sit waiting on reactions while the pages are open.
+    """
+
+    # Only allow pagination manipulation for 10 minutes
+    pagination_timeout = 600.0
+
+    def __init__(self, pages: list, requester: Union[User, Member]):
+        """Initializes the view on the first page.
+
+        :param pages:       A list of `discord.Embed` objects, where each embed
+                            is a page to display.
+        :param requester:   The user that asked for the help pages; nobody
+                            else can flip them.
+        """
+
+        super().__init__(timeout=self.pagination_timeout)
+
+        self.pages: list = pages
+        self.index: int = 0
+        self.requester_id: int = requester.id
+        # The message the view is attached to, so it can be cleaned up
+        self.message: Optional[Message] = None
+
+        self._update_buttons()
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        """Overridden from ui.View; only lets the requester flip the pages.
+
+        :param interaction: The interaction to validate.
+
+        :return:    Whether the button callback should run or not.
+        """
+
+        return interaction.user.id == self.requester_id
+
+    async def on_timeout(self):
+        """Overridden from ui.View; removes the buttons once they expire."""
+
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except HTTPException:
+                # The message is gone, so there's nothing to clean up
+                pass
+
+    @ui.button(emoji='⏪', style=ButtonStyle.secondary)
+    async def previous_page(self, interaction: Interaction,
+                            _button: ui.Button):
+        """Moves to the previous page.
+
+        :param interaction: The interaction that pressed the button.
+        :param _button:     The button that was pressed.
+        """
+
+        await self._show_page(interaction, self.index - 1)
+
+    @ui.button(emoji='⏩', style=ButtonStyle.secondary)
+    async def next_page(self, interaction: Interaction, _button: ui.Button):
+        """Moves to the next page.
+
+        :param interaction: The interaction that pressed the button.
+        :param _button:     The button that was pressed.
+        """
+
+        await self._show_page(interaction, self.index + 1)
+
+    async def _show_page(self, interaction: Interaction, index: int):
+        """Displays the page at the given index in response to an interaction.
+
+        :param interaction: The interaction to respond to.
+        :param index:       The index of the page to display; clamped to the
+                            available pages.
+        """
+
+        self.index = max(0, min(index, len(self.pages) - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.index],
+                                                view=self)
+
+    def _update_buttons(self):
+        """Disables the buttons that would move past the first or last page."""
+
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index == len(self.pages) - 1
 
 
 class HelpCog(ConfiguredCog):
     """A class supporting the `help` functionality."""
 
-    _left = '⏪'  # the left reaction for pagination
-    _right = '⏩'  # the right reaction for pagination
     _mail = '📧'  # mail reaction for the requester's message
 
+    _help_text_path = 'data/helptext.json'
+
+    # The parsed help text, and the modification time of the file it was
+    # parsed from, loaded on first use
+    _help_text_cache: Optional[dict] = None
+    _help_text_mtime: Optional[int] = None
+
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog and its help page caches.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The built help pages, along with the help text they were built from;
+        # the config never changes while the bot is running, so they only go
+        # stale when the help text is reloaded
+        self._pages_help_dict: Optional[dict] = None
+        self._summary_pages_cache: Optional[list] = None
+        self._detail_pages_cache: dict[str, list] = {}
+
     @commands.command()
     async def help(self,
                    ctx: commands.context,
@@ -142,127 +390,180 @@ class HelpCog(ConfiguredCog):
         :param command: The command to query details for.
         """
 
-        index: int = 0
-        message = None
-        action: callable = ctx.author.send
-        request_start = datetime.datetime.now()
-
         # Build the embeds to send
-        help_dict: dict = self._parse_help_text()
-        if command is None:
-            pages = self._build_help_summary(help_dict)
+        pages = self._get_help_pages(command)
+
+        if len(pages) == 1:
+            # Nothing to flip between, so don't bother with the buttons
+            view = None
         else:
-            pages = self._build_help_detail(help_dict, command)
-
-        await ctx.message.add_reaction(self._mail)
-
-        # Only allow pagination manipulation for 10 minutes
-        pagination_timeout = datetime.timedelta(minutes=10)
-        while datetime.datetime.now() - request_start < pagination_timeout:
-            # Push the current embed to the user
-            sent_message = await action(embed=pages[index])
-            if sent_message is not None:
-                message = sent_message
-
-            # Add controls
-            await message.add_reaction(self._left)
-            await message.add_reaction(self._right)
-
-            allow_decrease = index != 0
-            allow_increase = index != len(pages) - 1
-
-            # Check for reactions
-            check_method = self._get_check_method(message,
-                                                  allow_decrease,
-                                                  allow_increase)
-            react, _ = await self.bot.wait_for('reaction_add',
-                                               check=check_method)
-            if react.emoji == self._left:
-                index -= 1
-            elif react.emoji == self._right:
-                index += 1
-            action = message.edit
+            view = HelpPaginationView(pages, ctx.author)
 
-    @staticmethod
-    def _parse_help_text() -> dict:
-        """Parses the help text out into its corresponding data, converting
-        color strings to their numeric integers.
+        # Acknowledge the request and push the first page to the user at the
+        # same time, as neither request depends on the other
+        _, help_message = await asyncio.gather(
+            ctx.message.add_reaction(self._mail),
+            ctx.author.send(embed=pages[0], view=view))
+
+        if view is not None:
+            view.message = help_message
+
+    @classmethod
+    def _parse_help_text(cls) -> dict:
+        """Gets the parsed help text, only rereading the file when it has been
+        modified since it was last read.
+
+        The same cached dictionary is returned until the file changes, so
+        callers must not mutate it.
+
+        :return:    The parsed json data from the necessary data file, with
+                    some processing done to a few color fields.
+        """
+
+        mtime = os.stat(cls._help_text_path).st_mtime_ns
+        if cls._help_text_cache is None or mtime != cls._help_text_mtime:
+            cls.reload_help_text()
+
+        return cls._help_text_cache
+
+    @classmethod
+    def reload_help_text(cls) -> dict:
+        """Rereads the help text file into the cache, converting color strings
+        to their numeric integers.
 
         :return:    The parsed json data from the necessary data file, with
                     some processing done to a few color fields.
         """
 
-        with open('data/helptext.json', encoding='utf-8') as help_text_file:
+        # Note the modification time first, so that an edit made while reading
+        # is picked up on the next lookup
+        mtime = os.stat(cls._help_text_path).st_mtime_ns
+
+        with open(cls._help_text_path, 'rb') as help_text_file:
             help_text_dict = json.load(help_text_file)
             color = ConfiguredCog.convert_color(help_text_dict['color'])
             help_text_dict['color'] = color
 
+        cls._help_text_cache = help_text_dict
+        cls._help_text_mtime = mtime
         return help_text_dict
 
-    def _build_help_summary(self, help_dict: dict) -> list:
+    def _get_help_pages(self, command: Optional[str]) -> list:
+        """Gets the help pages for the summary or for a single command.
+
+        Every page is built up front whenever the help text is (re)loaded, so
+        a help request is just a lookup. Pages for unknown commands are built
+        on demand instead, so that arbitrary queries can't grow the cache.
+
+        :param command: The command to get the details of, or None for the
+                        command summary.
+
+        :return:    A list of `discord.Embed` objects, where each embed is a
+                    page to display that contains help information.
+        """
+
+        help_dict = self._parse_help_text()
+        if help_dict is not self._pages_help_dict:
+            # The help text was (re)loaded, so any built pages are stale
+            self._build_help_pages(help_dict)
+
+        if command is None:
+            return self._summary_pages_cache
+
+        pages = self._detail_pages_cache.get(command)
+        if pages is None:
+            return self._build_help_not_found(help_dict, command)
+
+        return pages
+
+    def _build_help_pages(self, help_dict: dict):
+        """Builds the summary pages and the detail pages for every enabled
+        command, replacing any pages that were built before.
+
+        :param help_dict:   The help text dictionary parsed from json.
+        """
+
+        enabled_commands = self._get_enabled_commands(help_dict)
+
+        # note that the "key" is the `command` part of the help text, which
+        # could have parameters described in it like so: "warn <action>
+        # <user>", so users only query by the first word of the command. Map
+        # that first word to the full key (keeping the first command found
+        # for each word), so we can use the full key from now on.
+        command_index = {}
+        for command in enabled_commands:
+            command_index.setdefault(command.split()[0], command)
+
+        self._pages_help_dict = help_dict
+        self._summary_pages_cache = self._build_help_summary(
+            help_dict, enabled_commands)
+        self._detail_pages_cache = {
+            command_name: self._build_help_detail(
+                help_dict, full_command_name,
+                enabled_commands[full_command_name])
+            for command_name, full_command_name in command_index.items()
+        }
+
+    @staticmethod
+    def _build_help_summary(help_dict: dict, enabled_commands: dict) -> list:
         """Takes the help data and builds a list of embeds to output to the
         user as needed.
 
-        :param help_dict:   The help text dictionary parsed from json.
+        :param help_dict:           The help text dictionary parsed from json.
+        :param enabled_commands:    The help data of every enabled command,
+                                    keyed by the command's full name.
 
         :return:    A list of `discord.Embed` objects that will be used as
                     pages when browsing the help command.
         """
 
         commands_per_embed = ConfiguredCog.config['help_commands_per_page']
-        command_index = 0
-        embed = None
         embed_list = []
 
-        enabled_commands = self._get_enabled_commands(help_dict)
-
-        # Build the paginated embeds for display,
-        # using the dictionary we just compiled
-        for command, command_data in enabled_commands.items():
-            # Check if first command on the page; build a new embed if so
-            if command_index % commands_per_embed == 0:
-                prefix = ConfiguredCog.config['command_prefix']
-                help_desc = help_dict['description'].format(prefix=prefix)
-                embed = Embed(title=help_dict['title'],
-                              description=help_desc,
-                              color=help_dict['color'])
-
-            # Add field
-            command_desc = command_data['description']
-            embed.add_field(name=command,
-                            value=command_desc,
-                            inline=False)
-
-            # Save the embed as a page if we've finished the page
-            if (command_index + 1) % commands_per_embed == 0:
-                # Add the embed to the list and clear the current embed
-                # (to prevent double-adding the embed)
-                embed_list.append(embed)
-                embed = None
-
-            command_index += 1
-
-        # Save the last embed as a page if it hasn't already been saved yet
-        if embed is not None:
-            embed_list.append(embed)
+        # Every page shares the same header, so only format it once
+        help_title = help_dict['title']
+        help_desc = help_dict['description'].format(
+            prefix=ConfiguredCog.config['command_prefix'])
+        help_color = help_dict['color']
+
+        # The number of ENABLED commands is known up front, so the page count
+        # (and thus each footer) can be worked out before building any pages
+        command_list = list(enabled_commands.items())
+        total_pages = ceil(len(command_list) / commands_per_embed)
+
+        # Build the paginated embeds for display, taking the next page's worth
+        # of commands from the list we just compiled for each one
+        for page_num in range(1, total_pages + 1):
+            embed = Embed(title=help_title,
+                          description=help_desc,
+                          color=help_color)
+
+            page_start = (page_num - 1) * commands_per_embed
+            page_commands = command_list[page_start:
+                                         page_start + commands_per_embed]
+            for command, command_data in page_commands:
+                embed.add_field(name=command,
+                                value=command_data['description'],
+                                inline=False)
 
-        # Build the footer, now that we have a fully compiled list of all the
-        # ENABLED commands
-        total_pages = len(embed_list)
-        page_num = 1
-        for embed in embed_list:
             embed.set_footer(text=f'Page {page_num}/{total_pages}')
-            page_num += 1
+            embed_list.append(embed)
 
         return embed_list
 
-    def _build_help_detail(self, help_dict: dict, command_name: str) -> list:
+    @staticmethod
+    def _build_help_detail(help_dict: dict,
+                           full_command_name: str,
+                           command_data: dict) -> list:
         """Builds the embed data for the command detail.
 
-        :param help_dict:       The data dictionary that has the help
-                                information.
-        :param command_name:    The command keyword to search the help
-                                dictionary for.
+        :param help_dict:           The data dictionary that has the help
+                                    information.
+        :param full_command_name:   The full command key from the help
+                                    dictionary, including any parameters.
+        :param command_data:        The command's entry from the enabled
+                                    commands, with a 'description' and
+                                    'details'.
 
         :return:    A list of `discord.Embed` objects, where each embed is a
                     page to display that contains help information.
@@ -270,31 +571,7 @@ class HelpCog(ConfiguredCog):
 
         embed_list: list = []
 
-        enabled_commands = self._get_enabled_commands(help_dict)
-
-        # Error catching for invalid commands
-        full_command_name = None
-        for command in enabled_commands:
-            # note that the "key" is the `command` part of the help text, which
-            # could have parameters described in it like so:
-            # "warn <action> <user>", so we only need to validate against the
-            # first word of the command for the user's query. If we succeed,
-            # jot down the full key, so we can use that from now on.
-            if command_name == command.split()[0]:
-                full_command_name = command
-                break
-
-        if not full_command_name:
-            # Command not found, return an error embed to the user
-            embed = Embed(title=command_name,
-                          description='Command not found',
-                          color=help_dict['color'])
-            embed.set_footer(text='Page 1/1')
-            embed_list.append(embed)
-            return embed_list
-
         # Build the basic description of the command
-        command_data = enabled_commands[full_command_name]
         embed = Embed(title=full_command_name,
                       description=command_data['description'],
                       color=help_dict['color'])
@@ -310,6 +587,25 @@ class HelpCog(ConfiguredCog):
 
         return embed_list
 
+    @staticmethod
+    def _build_help_not_found(help_dict: dict, command_name: str) -> list:
+        """Builds the error embed data for a command that couldn't be found.
+
+        :param help_dict:       The data dictionary that has the help
+                                information.
+        :param command_name:    The command keyword the user searched for.
+
+        :return:    A list containing a single `discord.Embed` page that tells
+                    the user the command wasn't found.
+        """
+
+        embed = Embed(title=command_name,
+                      description='Command not found',
+                      color=help_dict['color'])
+        embed.set_footer(text='Page 1/1')
+
+        return [embed]
+
     def _get_enabled_commands(self, help_dict: dict) -> dict:
         """Compile a dictionary of all the valid commands from all the enabled
         cogs, where the key is the command, and the value is the description.
@@ -321,59 +617,15 @@ class HelpCog(ConfiguredCog):
         """
         enabled_commands: dict = {}
 
-        for cog_name in help_dict['cogs']:
-            if self.is_cog_enabled(cog_name) or \
-                    self.is_cog_enabled(cog_name) is None:
-                cog_commands = help_dict['cogs'][cog_name]
-
-                for cog_command_dict in cog_commands:
-                    # Build command information
-                    desc = cog_command_dict['description']
-                    command_data = {'description': desc, 'details': []}
-                    if 'details' in cog_command_dict:
-                        command_data['details'] = cog_command_dict['details']
-
-                    # Add the command and its details
-                    # to the enabled commands dict
-                    command_name = cog_command_dict['command']
-                    enabled_commands[command_name] = command_data
+        for cog_name, cog_commands in help_dict['cogs'].items():
+            # Cogs missing from the config (None) are treated as enabled
+            if self.is_cog_enabled(cog_name) is not False:
+                # Add the commands and their details
+                # to the enabled commands dict
+                enabled_commands.update(
+                    (cog_command_dict['command'],
+                     {'description': cog_command_dict['description'],
+                      'details': cog_command_dict.get('details', [])})
+                    for cog_command_dict in cog_commands)
 
         return enabled_commands
-
-    def _get_check_method(self,
-                          message: Message,
-                          allow_decrease: bool,
-                          allow_increase: bool) -> callable([..., bool]):
-        """Builds and returns a method that can be plugged into a bot's check
-        functionality. The method's allow_decrease and allow_increase variables
-        will be "baked" into the method before it's passed to the bot, which
-        will be able to alter the flow of functionality when watching for
-        reacts.
-
-        :param message:         The message instance that we are watching
-                                reacts from.
-        :param allow_decrease:  Whether to allow going one page back or not.
-        :param allow_increase:  Whether to allow going one page forward or not.
-
-        :return:    A method that takes some number of arguments and returns a
-                    boolean on whether you can move to the page desired.
-        """
-
-        def _check(reaction: Reaction, user: ClientUser) -> bool:
-            """Checks to see if the reaction can trigger the help pagination
-            event.
-
-            :param reaction:    The reaction to validate.
-            :param user:        The user that sent the reaction.
-
-            :return:    Whether the waited process should fire or not.
-            """
-            if reaction.message.id != message.id or user == self.bot.user:
-                return False
-            if allow_decrease and reaction.emoji == self._left:
-                return True
-            if allow_increase and reaction.emoji == self._right:
-                return True
-            return False
-
-        return _check
@@ -1,13 +1,17 @@
 """A module for cogs that hold entertainment value."""
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
 import json
-import urllib.request
 from enum import Enum
-from random import randint, sample, choices
-from typing import Optional
+from random import randint, choice, choices
+from typing import NamedTuple, Optional
 
+import aiohttp
 from discord.ext import commands, tasks
-from discord import Embed, TextChannel
+from discord import Embed, TextChannel, utils
 
 from src.cogs.base import ConfiguredCog
 from src.data import data_access
@@ -25,12 +29,141 @@ class CookieHuntTarget(Enum):
     LEADER = 'leader'
 
 
+class CookieHuntSettings(NamedTuple):
+    """The cookie hunt settings used on every drop and claim, worked out
+    once when the cog is built."""
+    # The number of cookies needed to win
+    goal: int
+    # The fewest and most hours to wait between drops
+    hour_variance: tuple
+    # The names of the channels a cookie may be dropped in, in the configured
+    # order, and as a set for quick lookups
+    allowed_channels: list
+    allowed_channel_names: frozenset
+    # The message announcing a cookie drop
+    drop_embed: Embed
+    # The running totals of the cookie weights, in the same order as the
+    # cookie data
+    cumulative_weights: tuple
+
+
+class CookieHuntCache:
+    """A cache of the database user ids and cookie counts of discord ids,
+    only remembering the most recently used discord ids."""
+
+    def __init__(self, max_size: int):
+        """Initializes the cache, empty.
+
+        :param max_size:    The most discord ids each cache will remember,
+                            dropping the least recently used beyond that.
+        """
+
+        self._max_size = max_size
+
+        # Discord ids mapped to their database user ids (which never change)
+        # and to their cookie counts (which only change through the cog)
+        self._user_ids: OrderedDict[int, int] = OrderedDict()
+        self._cookie_counts: OrderedDict[int, int] = OrderedDict()
+
+    def find_user_id(self, discord_id: int) -> int:
+        """Finds the database's user id for the discord id, only querying the
+        database when the discord id isn't already cached.
+
+        :param discord_id:  The discord id to search for.
+
+        :return:    The database's user id key.
+        """
+
+        user_id = self._get(self._user_ids, discord_id)
+        if user_id is None:
+            user_id = data_access.find_user_id_by_discord_id(discord_id)
+            self._set(self._user_ids, discord_id, user_id)
+
+        return user_id
+
+    def get_cookie_count(self, discord_id: int) -> int:
+        """Gets the cookie count for the discord id, only querying the
+        database when the count isn't already known.
+
+        :param discord_id:  The discord ID to find the cookie count for.
+
+        :return:    The number of cookies collected by the user with the
+                    specified discord ID.
+        """
+
+        cookie_count = self._get(self._cookie_counts, discord_id)
+        if cookie_count is None:
+            cookie_count = data_access.get_cookie_count_by_discord_id(
+                discord_id)
+            self._set(self._cookie_counts, discord_id, cookie_count)
+
+        return cookie_count
+
+    def set_cookie_count(self, discord_id: int, cookie_count: int):
+        """Remembers the new cookie count of a discord id.
+
+        :param discord_id:      The discord ID whose cookie count changed.
+        :param cookie_count:    The discord ID's new cookie count.
+        """
+
+        self._set(self._cookie_counts, discord_id, cookie_count)
+
+    def clear_cookie_counts(self):
+        """Forgets every cookie count, for when they are all reset."""
+
+        self._cookie_counts.clear()
+
+    def clear(self):
+        """Forgets everything in the cache."""
+
+        self._user_ids.clear()
+        self._cookie_counts.clear()
+
+    @staticmethod
+    def _get(cache: OrderedDict, discord_id: int) -> Optional[int]:
+        """Looks up a discord id in one of the caches, marking it as the
+        most recently used.
+
+        :param cache:       The cache to search.
+        :param discord_id:  The discord id to search for.
+
+        :return:    The cached value, or None if the discord id isn't cached.
+        """
+
+        if discord_id not in cache:
+            return None
+
+        cache.move_to_end(discord_id)
+        return cache[discord_id]
+
+    def _set(self, cache: OrderedDict, discord_id: int, value: int):
+        """Stores a value for a discord id in one of the caches, dropping
+        the least recently used discord id if the cache is full.
+
+        :param cache:       The cache to store the value in.
+        :param discord_id:  The discord id to store the value for.
+        :param value:       The value to store.
+        """
+
+        cache[discord_id] = value
+        cache.move_to_end(discord_id)
+        if len(cache) > self._max_size:
+            cache.popitem(last=False)
+
+
 class CookieHuntCog(ConfiguredCog):
     """A class supporting the "Cookie Hunt" feature, including the `gimme` and
     `sugar` commands."""
 
     config_name = 'cookieHunt'
 
+    # The color used by all cookie embeds
+    _cookie_color: int = ConfiguredCog.convert_color('#8a4b38')
+
+    # The most discord ids the cog's caches will remember, dropping the least
+    # recently used beyond that
+    _cache_max_size = 1000
+
     def __init__(self, bot: commands.Bot):
         """Initializes the cog and starts the automated task.
 
@@ -43,11 +176,28 @@ class CookieHuntCog(ConfiguredCog):
         # Init instance vars
         self.cookie_data = self._parse_cookie_data()
         self.cookie_available = False
-        self.cookie_prepared_timestamp = None
-        self.cookie_drop_delay_hours = None
-        self.cookie_drop_delay_minutes = None
+        self.cookie_drop_time = None
         self.cookie_type = None
 
+        # Settings used on every drop and claim; the config is only loaded
+        # once, and the drop message never changes, so they are all worked
+        # out up front
+        content_config = self.config['content']
+        self._settings = CookieHuntSettings(
+            goal=content_config['cookie_hunt_goal'],
+            hour_variance=tuple(content_config['cookie_hunt_hour_variance']),
+            allowed_channels=content_config['cookie_hunt_allowed_channels'],
+            allowed_channel_names=frozenset(
+                content_config['cookie_hunt_allowed_channels']),
+            drop_embed=self._build_cookie_drop_embed(),
+            cumulative_weights=self._get_cookie_cumulative_weights())
+
+        self._cache = CookieHuntCache(self._cache_max_size)
+        # Set whenever a drop is prepared or made, to wake the scheduler; it's
+        # only created once the cog is loaded, so that it belongs to the bot's
+        # running event loop
+        self._cookie_state_changed: Optional[asyncio.Event] = None
+
     @commands.command()
     async def gimme(self, ctx: commands.Context):
         """The origin point for the `gimme` command. Claims a cookie for the
@@ -74,24 +224,23 @@ class CookieHuntCog(ConfiguredCog):
                                                        ctx)
 
         # Award points as needed
-        db_user_id = data_access.find_user_id_by_discord_id(target_discord_id)
+        db_user_id = self._cache.find_user_id(target_discord_id)
         cookie_count = data_access.modify_cookie_count(db_user_id,
                                                       cookie_type['modifier'])
+        self._cache.set_cookie_count(target_discord_id, cookie_count)
 
         # check if goal was reached by the claimer
-        cookie_goal = ConfiguredCog.config['content']['cookie_hunt_goal']
+        cookie_goal = self._settings.goal
         if cookie_count >= cookie_goal:
             await self.award_winner(ctx)
 
             # reset cookie counts
             data_access.reset_all_cookies()
+            self._cache.clear_cookie_counts()
             return
 
         # Figure out proper grammar
-        if cookie_count == 1:
-            cookie_grammar_word = 'cookie'
-        else:
-            cookie_grammar_word = 'cookies'
+        cookie_grammar_word = self._cookie_word(cookie_count)
 
         # Send a message saying they got the cookie
         if cookie_type['target'] == CookieHuntTarget.CLAIMER:
@@ -99,7 +248,7 @@ class CookieHuntCog(ConfiguredCog):
                            f'cookie! They now have {cookie_count} '
                            f'{cookie_grammar_word}.')
         else:
-            target_user = self.bot.get_user(int(target_discord_id))
+            target_user = self.bot.get_user(target_discord_id)
             if target_user:
                 target_user_name = target_user.name
             else:
@@ -110,6 +259,17 @@ class CookieHuntCog(ConfiguredCog):
                            f'{target_user_name}, now has {cookie_count} '
                            f'{cookie_grammar_word}.')
 
+    @staticmethod
+    def _cookie_word(cookie_count: int) -> str:
+        """Picks the grammatically correct word for a number of cookies.
+
+        :param cookie_count:    The number of cookies being described.
+
+        :return:    'cookie' for exactly one cookie, 'cookies' otherwise.
+        """
+
+        return 'cookie' if cookie_count == 1 else 'cookies'
+
     @staticmethod
     def get_target_discord_id(target: CookieHuntTarget,
                               ctx: commands.Context) -> int:
@@ -139,20 +299,32 @@ class CookieHuntCog(ConfiguredCog):
         await ctx.send(f'Oh my, it looks like {ctx.author.name} is the '
                        f'cookie monster!')
 
-        cookie_goal = ConfiguredCog.config['content']['cookie_hunt_goal']
+        cookie_goal = self._settings.goal
 
         # Award the role
         role = ConfiguredCog.config['content']['cookie_hunt_winner_role']
         role_data = self.find_role_in_guild(role, ctx.guild)
         if role_data:
-            # Remove role from all users
-            for member in ctx.guild.members:
-                if role_data in member.roles:
-                    reason = 'No longer the cookie hunt winner.'
-                    await member.remove_roles(role_data,
-                                              reason=reason)
+            # Find everyone holding the role in one pass over the guild; the
+            # winner keeps it if they already have it
+            holders = role_data.members
+            winner_has_role = ctx.author in holders
+            if winner_has_role:
+                holders.remove(ctx.author)
+
+            # Remove role from all other users, all at once rather than
+            # waiting on each request in turn
+            reason = 'No longer the cookie hunt winner.'
+            results = await asyncio.gather(
+                *(member.remove_roles(role_data, reason=reason)
+                  for member in holders),
+                return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error('Failed to remove the cookie hunt '
+                                      'winner role: %s', result)
             # Give the role to the winner
-            if not self.member_contains_role(role_data.name, ctx.author):
+            if not winner_has_role:
                 reason = f'First to grab {cookie_goal} cookies.'
                 await ctx.author.add_roles(role_data, reason=reason)
 
@@ -167,7 +339,17 @@ class CookieHuntCog(ConfiguredCog):
         """
 
         if options is not None:
-            if options.lower() == CookieHuntSugarOptions.HIGH.value:
+            # Look the option up by value, rather than comparing the string
+            # against each option in turn
+            try:
+                sugar_option = CookieHuntSugarOptions(options.lower())
+            except ValueError:
+                # Unknown option error
+                await ctx.send(f'Unknown command `{options}`, please re-enter '
+                               f'your command and try again.')
+                return
+
+            if sugar_option == CookieHuntSugarOptions.HIGH:
                 # Get the high scores
                 top_collectors = data_access.get_top_cookie_collectors(3)
 
@@ -177,13 +359,12 @@ class CookieHuntCog(ConfiguredCog):
                 for discord_id, cookie_count in top_collectors:
                     if not collectors_displayed:
                         # Only build the embed the first time through the loop
-                        color = ConfiguredCog.convert_color('#8a4b38')
                         embed = Embed(title='Top Cookie Collectors',
-                                      color=color)
+                                      color=self._cookie_color)
 
                         collectors_displayed = True
 
-                    discord_user = self.bot.get_user(int(discord_id))
+                    discord_user = self.bot.get_user(discord_id)
                     if discord_user:
                         user_name = discord_user.name
                     else:
@@ -202,19 +383,12 @@ class CookieHuntCog(ConfiguredCog):
                 else:
                     # Our query returned no results
                     await ctx.send('_No one has gotten any cookies yet!_')
-            else:
-                # Unknown option error
-                await ctx.send(f'Unknown command `{options}`, please re-enter '
-                               f'your command and try again.')
         else:
             # Find cookie count for the user
-            cookies = data_access.get_cookie_count_by_discord_id(ctx.author.id)
+            cookies = self._cache.get_cookie_count(ctx.author.id)
 
             # Figure out proper grammar
-            if cookies == 1:
-                cookie_word = 'cookie'
-            else:
-                cookie_word = 'cookies'
+            cookie_word = self._cookie_word(cookies)
 
             # Give the requesting user's score
             await ctx.send(f'{ctx.author.name} has {cookies} {cookie_word}.')
@@ -228,80 +402,104 @@ class CookieHuntCog(ConfiguredCog):
         :param ctx: The command context.
         """
 
-        await self._check_to_send_cookie(True)
-
-    @tasks.loop(minutes=1)
-    async def _check_to_send_cookie(self, force_drop: bool = False):
-        """A looping task to check if a cookie needs to be sent.
+        if not self.cookie_available:
+            await self._drop_cookie()
 
-        Checks a few parameters such as a randomized time delay and whether
-        there's already an available cookie to claim. If all the parameters
-        have been met, picks a random channel from a configured list and drops
-        a cookie into that channel for claiming.
+    @tasks.loop()
+    async def _cookie_drop_scheduler(self):
+        """A looping task that drops a cookie once its drop is due.
 
-        :param force_drop:  Overrides any delays and force a cookie to drop
-                            immediately.
+        Rather than polling, each pass sleeps until the prepared drop time, or
+        until the cookie state changes (a drop was claimed, forced or
+        rescheduled), whichever comes first. While a dropped cookie is
+        unclaimed there is nothing to schedule, so it just waits for the claim.
         """
 
-        # If random number isn't set, plan out a new cookie drop
-        if self.cookie_drop_delay_hours is None:
+        # If a drop isn't planned yet, plan out a new cookie drop
+        if self.cookie_drop_time is None:
             self._prep_cookie_drop()
 
-        # If current timestamp is after the logged timestamp + random number's
-        # hours, then drop a cookie in a random channel from the list of
-        # channels (assuming we can find the channels by name)
-        time_delta = datetime.now() - self.cookie_prepared_timestamp
-        hours = self.cookie_drop_delay_hours
-        minutes = self.cookie_drop_delay_minutes
-        if ((force_drop or
-             time_delta > timedelta(hours=hours, minutes=minutes))
-                and not self.cookie_available):
-            self.logger.debug('Dropping a cookie.')
-
-            # Build the cookie drop message
-            prefix = ConfiguredCog.config['command_prefix']
-            color = ConfiguredCog.convert_color('#8a4b38')
-            description = (f'Here, have a cookie! '
-                           f'Use `{prefix}gimme` to take it!')
-            cookie_drop_embed = Embed(color=color,
-                                      title=':cookie:',
-                                      description=description)
-
-            # Pick a random channel to send it to
-            channel = self._pick_random_channel_to_send()
-
-            if channel is not None:
-                self.cookie_available = True
-
-                await channel.send(embed=cookie_drop_embed)
-            else:
-                self.logger.error('No valid channels were found. '
-                                  'Skipping drop.')
+        self._cookie_state_changed.clear()
+
+        if self.cookie_available:
+            timeout = None
+        else:
+            time_delta = self.cookie_drop_time - datetime.now()
+            timeout = max(time_delta.total_seconds(), 0)
+
+        try:
+            await asyncio.wait_for(self._cookie_state_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            # Nothing changed before the drop was due, so drop the cookie
+            if not await self._drop_cookie():
+                # Try again in a minute, in case the channels show up
+                self.cookie_drop_time = datetime.now() + timedelta(minutes=1)
+
+    async def _drop_cookie(self) -> bool:
+        """Picks a random channel from a configured list and drops a cookie
+        into that channel for claiming.
+
+        :return:    True if the cookie was dropped, False if no valid channel
+                    could be found.
+        """
+
+        # Pick a random channel to send it to
+        channel = self._pick_random_channel_to_send()
+
+        if channel is None:
+            self.logger.error('No valid channels were found. Skipping drop.')
+            return False
+
+        self.logger.debug('Dropping a cookie.')
+
+        self.cookie_available = True
+        self._cookie_state_changed.set()
+
+        await channel.send(embed=self._settings.drop_embed)
+        return True
 
     async def cog_load(self):
         """Overridden from commands.Cog; starts the automated task."""
 
+        self._cookie_state_changed = asyncio.Event()
+
         # pylint: disable-msg=E1101
-        self._check_to_send_cookie.start()
+        self._cookie_drop_scheduler.start()
 
     async def cog_unload(self):
-        """Overridden from commands.Cog; stops the automated task."""
+        """Overridden from commands.Cog; stops the automated task and
+        forgets the cached database values."""
 
         # pylint: disable-msg=E1101
-        self._check_to_send_cookie.cancel()
+        self._cookie_drop_scheduler.cancel()
+
+        self._cache.clear()
+
+    @classmethod
+    def _build_cookie_drop_embed(cls) -> Embed:
+        """Builds the message announcing a cookie drop.
+
+        :return:    The embed to send when a cookie is dropped.
+        """
+
+        prefix = ConfiguredCog.config['command_prefix']
+        description = (f'Here, have a cookie! '
+                       f'Use `{prefix}gimme` to take it!')
+        return Embed(color=cls._cookie_color,
+                     title=':cookie:',
+                     description=description)
 
     def _prep_cookie_drop(self):
         """Sets up the class's instance variables for a new cookie drop in the
         future.
         """
 
-        variance_key = 'cookie_hunt_hour_variance'
-        min_hour = ConfiguredCog.config['content'][variance_key][0]
-        max_hour = ConfiguredCog.config['content'][variance_key][1]
+        min_hour, max_hour = self._settings.hour_variance[:2]
         hour_delay = randint(min_hour, max_hour)
         # Pick a random minute within the hour to drop it
         minute_delay = randint(0, 59)
-        cookie_type = choices(self.cookie_data, self._get_cookie_weights())[0]
+        cookie_type = choices(self.cookie_data,
+                              cum_weights=self._settings.cumulative_weights)[0]
 
         self.logger.debug('Preparing a cookie drop for about %s hours and '
                           '%s minutes from now. It is a %s cookie.',
@@ -309,39 +507,43 @@ class CookieHuntCog(ConfiguredCog):
                           minute_delay,
                           cookie_type['name'])
         self.cookie_available = False
-        self.cookie_prepared_timestamp = datetime.now()
-        self.cookie_drop_delay_hours = hour_delay
-        self.cookie_drop_delay_minutes = minute_delay
+        self.cookie_drop_time = datetime.now() + timedelta(
+            hours=hour_delay, minutes=minute_delay)
         self.cookie_type = cookie_type
+        self._cookie_state_changed.set()
 
     @staticmethod
-    def _parse_cookie_data() -> dict:
-        """Parses the cookie file out into its corresponding data
+    @lru_cache(maxsize=1)
+    def _parse_cookie_data() -> tuple:
+        """Parses the cookie file out into its corresponding data.
+
+        The file is only read once per process; every later call returns the
+        same cached data, so callers must not mutate it.
 
         :return:    The parsed json data from the necessary data file
         """
 
-        with open('data/cookies.json', encoding='utf-8') as cookie_data_file:
-            cookie_data_dict = json.load(cookie_data_file)
+        with open('data/cookies.json', 'rb') as cookie_data_file:
+            cookie_data_list = json.load(cookie_data_file)
 
         # Cast the necessary data
-        for cookie_type in cookie_data_dict:
+        for cookie_type in cookie_data_list:
             cookie_type['weight'] = float(cookie_type['weight'])
             cookie_type['target'] = CookieHuntTarget(cookie_type['target'])
 
-        return cookie_data_dict
+        return tuple(cookie_data_list)
 
-    def _get_cookie_weights(self) -> list:
-        """Gets an arbitrarily ordered list of weights mapped to the cookie
-        data dictionary.
+    def _get_cookie_cumulative_weights(self) -> tuple:
+        """Gets the running totals of the cookie weights, in the same order as
+        the cookie data.
 
-        :return:    A list of weights.
-        """
-        cookie_weights = []
-        for cookie_type in self.cookie_data:
-            cookie_weights.append(cookie_type['weight'])
+        Passing these to `random.choices` as `cum_weights` saves it from
+        re-accumulating the weights on every pick.
 
-        return cookie_weights
+        :return:    A tuple of cumulative weights.
+        """
+        return tuple(accumulate(cookie_type['weight']
+                                for cookie_type in self.cookie_data))
 
     def _pick_random_channel_to_send(self) -> Optional[TextChannel]:
         """Takes the preconfigured list of available channels that we can drop
@@ -351,20 +553,23 @@ class CookieHuntCog(ConfiguredCog):
                     if no valid options were found.
         """
 
-        # Shuffle the whole list of all the channels we can access,
-        # so that in case we can't find the first channel
-        # that we randomly picked, we move on to the next one safely.
-        channel_key = 'cookie_hunt_allowed_channels'
-        allowed_channels = ConfiguredCog.config['content'][channel_key]
-        random_channel_pick_list = sample(allowed_channels,
-                                          len(allowed_channels))
-        for selected_channel_name in random_channel_pick_list:
-            for channel in self.bot.get_all_channels():
-                if (channel.name == selected_channel_name and
-                        isinstance(channel, TextChannel)):
-                    # Found a channel that matches the name in the config,
-                    # therefore this is the random channel selected
-                    return channel
+        allowed_channel_names = self._settings.allowed_channel_names
+
+        # Index the allowed text channels by name in a single pass, keeping
+        # the first channel found for each name
+        channels_by_name = {}
+        for channel in self.bot.get_all_channels():
+            if (isinstance(channel, TextChannel) and
+                    channel.name in allowed_channel_names):
+                channels_by_name.setdefault(channel.name, channel)
+
+        # Only pick from the configured channels that could actually be
+        # found, in the configured order
+        candidates = [channels_by_name[channel_name]
+                      for channel_name in self._settings.allowed_channels
+                      if channel_name in channels_by_name]
+        if candidates:
+            return choice(candidates)
 
         # No valid channel options, return None
         return None
@@ -375,6 +580,23 @@ class DiceRollerCog(ConfiguredCog):
 
     config_name = 'diceRoller'
 
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog along with the lexer and parser used for every
+        roll.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The color of every roll result; the config is only loaded once
+        self._result_color: int = self.convert_color(
+            self.config['content']['dice_result_embed_color'])
+
+        self._lexer = DiceLexer()
+        self._parser = DiceParser()
+
     @commands.command()
     async def roll(self, ctx: commands.context, dice: str):
         """The origin point for the dice roll command.
@@ -384,11 +606,9 @@ class DiceRollerCog(ConfiguredCog):
         """
 
         if dice:
-            lexer = DiceLexer()
-            parser = DiceParser()
-
             try:
-                step_data, result = parser.parse(lexer.tokenize(dice))
+                step_data, result = self._parser.parse(
+                    self._lexer.tokenize(dice))
             except TypeError:
                 await ctx.send('There was an error with your roll syntax. '
                                'Please try again.')
@@ -397,20 +617,20 @@ class DiceRollerCog(ConfiguredCog):
             if result.is_integer():
                 result = int(result)
 
-            color = ConfiguredCog.config['content']['dice_result_embed_color']
-            color = ConfiguredCog.convert_color(color)
             title = f'Roll for {ctx.author.name}'
+            steps = ''.join(f'{step}\n' for step in step_data)
             description = (f'**Result:**\n'
                            f'```\n'
                            f'{result}\n'
                            f'```\n'
                            f'**Steps:**\n'
-                           f'```\n')
-            for step in step_data:
-                description += step + '\n'
-            description += '```'
+                           f'```\n'
+                           f'{steps}'
+                           f'```')
 
-            embed = Embed(color=color, title=title, description=description)
+            embed = Embed(color=self._result_color,
+                          title=title,
+                          description=description)
 
             await ctx.send(embed=embed)
 
@@ -425,11 +645,122 @@ class DiceRollerCog(ConfiguredCog):
         return await self.roll(ctx, text)
 
 
+class DrawingPromptFetcher:
+    """Fetches the newest posts from reddit.com/r/SketchDaily and searches
+    them for a day's drawing prompt.
+
+    The page is requested conditionally, so if it hasn't changed since it was
+    last searched for the same day's prompt, that search's result is reused.
+    """
+
+    # The subreddit's newest posts, as JSON rather than a full web page
+    _prompt_url = 'https://www.reddit.com/r/SketchDaily/new.json'
+
+    def __init__(self):
+        """Initializes the fetcher, without an HTTP session until it's
+        opened."""
+
+        # The HTTP session used to fetch the prompt page
+        self._http: Optional[aiohttp.ClientSession] = None
+        # The validators the page was last served with, along with the date
+        # and prompt it was parsed for, so that an unchanged page isn't
+        # downloaded and searched again
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_date: Optional[str] = None
+        self._fetched_prompt = ''
+
+    def open(self):
+        """Opens the HTTP session used to fetch the prompt page. Must be called
+        from within the bot's running event loop."""
+
+        self._http = aiohttp.ClientSession(
+            headers={'User-Agent': 'Mozilla/5.0'})
+
+    async def close(self):
+        """Closes the HTTP session, if it was opened."""
+
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def fetch(self, neat_date: str) -> str:
+        """Gets the drawing prompt for a day, if it's been posted.
+
+        :param neat_date:   The day to find the prompt for, in the format
+                            `[Month] [Numeric Day][st|nd|rd|th]`.
+
+        :return: The drawing prompt if there is one found for the day; or an
+        empty string if none for the day was found.
+        """
+
+        headers = {}
+        if self._fetched_date == neat_date:
+            # The last search was for the same day, so it still holds if the
+            # page hasn't changed since
+            if self._etag is not None:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified is not None:
+                headers['If-Modified-Since'] = self._last_modified
+
+        async with self._http.get(self._prompt_url,
+                                  headers=headers) as response:
+            if response.status == 304:
+                return self._fetched_prompt
+
+            response.raise_for_status()
+            posts = await response.json()
+
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+
+        self._fetched_date = neat_date
+        self._fetched_prompt = self._find_drawing_prompt(posts, neat_date)
+        return self._fetched_prompt
+
+    @staticmethod
+    def _find_drawing_prompt(posts: dict, neat_date: str) -> str:
+        """Searches the SketchDaily post titles for a day's drawing prompt.
+
+        :param posts:       The subreddit's post listing, as parsed from
+                            reddit's JSON.
+        :param neat_date:   The day to find the prompt for, in the format
+                            `[Month] [Numeric Day][st|nd|rd|th]`.
+
+        :return: The drawing prompt if there is one found for the day; or an
+        empty string if none for the day was found.
+        """
+
+        # search for the day's theme in the skd post titles
+        prompt_start = neat_date + ' - '
+        for post in posts['data']['children']:
+            title = post['data']['title']
+            loc = title.find(prompt_start)
+            if loc != -1:
+                return title[loc:loc + 100]
+
+        # if we can't find the day's theme, return a blank string
+        return ''
+
+
 class AutoDrawingPromptCog(ConfiguredCog):
     """A class supporting the Drawing Prompt automatic posting functionality"""
 
     config_name = 'autoDrawingPrompt'
 
+    _months = ('January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November',
+               'December')
+    # The ordinal suffix for each day of the month, indexed by the day
+    _day_suffixes = tuple('st' if day in (1, 21, 31) else
+                          'nd' if day in (2, 22) else
+                          'rd' if day in (3, 23) else
+                          'th'
+                          for day in range(32))
+
+    # Where the last posted prompt is saved, so restarts don't repost it
+    _prompt_state_path = 'data/drawing_prompt.json'
+
     def __init__(self, bot: commands.Bot):
         """Initializes the cog and starts the automated task
 
@@ -439,6 +770,47 @@ class AutoDrawingPromptCog(ConfiguredCog):
 
         super().__init__(bot)
         self.current_prompt = ''
+        # The ISO date that the current prompt was posted on
+        self.current_prompt_date: Optional[str] = None
+        self._load_prompt_state()
+
+        # Where and how the prompt is posted; the config is only loaded once
+        self._prompt_channel_name: str = (
+            self.config['content']['daily_prompt_channel'])
+        self._prompt_color: int = self.convert_color(
+            self.config['content']['prompt_color'])
+        # The channel the prompt is posted to, found on first use
+        self._prompt_channel: Optional[TextChannel] = None
+
+        # Fetches the prompt page, with an HTTP session opened on load
+        self._fetcher = DrawingPromptFetcher()
+
+    def _load_prompt_state(self):
+        """Loads the last posted prompt, and the date it was posted on, from
+        disk, if it was saved."""
+
+        try:
+            with open(self._prompt_state_path, 'rb') as prompt_state_file:
+                prompt_state = json.load(prompt_state_file)
+        except (OSError, ValueError):
+            # Nothing saved (or it's unreadable), so start fresh
+            return
+
+        self.current_prompt = prompt_state.get('prompt', '')
+        self.current_prompt_date = prompt_state.get('date')
+
+    def _save_prompt_state(self):
+        """Saves the current prompt, and the date it was posted on, to disk."""
+
+        try:
+            with open(self._prompt_state_path, 'w',
+                      encoding='utf-8') as prompt_state_file:
+                json.dump({'date': self.current_prompt_date,
+                           'prompt': self.current_prompt},
+                          prompt_state_file)
+        except OSError as exception:
+            self.logger.error('Failed to save the drawing prompt: %s',
+                              exception)
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -447,19 +819,25 @@ class AutoDrawingPromptCog(ConfiguredCog):
         await self._get_sketch_prompt()
 
     async def cog_load(self):
-        """Overridden from commands.Cog; starts the automated task."""
+        """Overridden from commands.Cog; opens the HTTP session and starts the
+        automated task."""
+
+        self._fetcher.open()
 
         # pylint: disable-msg=E1101
         self._get_sketch_prompt.start()
 
     async def cog_unload(self):
-        """Overridden from commands.Cog; stops the automated task."""
+        """Overridden from commands.Cog; stops the automated task and closes
+        the HTTP session."""
 
         # pylint: disable-msg=E1101
         self._get_sketch_prompt.cancel()
 
-    @staticmethod
-    def _get_neat_date(date: datetime) -> str:
+        await self._fetcher.close()
+
+    @classmethod
+    def _get_neat_date(cls, date: datetime) -> str:
         """Takes a datetime object and converts the day and month into a
         cleanly formatted string.
 
@@ -468,26 +846,11 @@ class AutoDrawingPromptCog(ConfiguredCog):
         :return:    The formatted month and day in the format
                     `[Month] [Numeric Day][st|nd|rd|th]`
         """
-        month_selector = ["January", "February", "March", "April", "May",
-                          "June", "July", "August", "September", "October",
-                          "November", "December"]
-        month_string = month_selector[date.month - 1]
-
         day = date.day
 
-        if day in (1, 21, 31):
-            suffix = "st"
-        elif day in (2, 22):
-            suffix = "nd"
-        elif day in (3, 23):
-            suffix = "rd"
-        else:
-            suffix = "th"
-
-        neat_date = f"{month_string} {day}{suffix}"
-        return neat_date
+        return f'{cls._months[date.month - 1]} {day}{cls._day_suffixes[day]}'
 
-    def _get_daily_drawing_prompt(self) -> str:
+    async def _get_daily_drawing_prompt(self) -> str:
         """Gets today's drawing prompt from reddit.com/r/SketchDaily, if it
         exists.
 
@@ -495,32 +858,7 @@ class AutoDrawingPromptCog(ConfiguredCog):
         an empty string if none for today was found.
         """
 
-        url = 'https://reddit.com/r/SketchDaily/new'
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        with (urllib.request.urlopen(urllib.request.Request(url,
-                                                            headers=headers))
-              as site):
-            site_str = site.read().decode('utf-8')
-
-        # search for today's theme on the skd site
-        now = datetime.now()
-        neat_today_date = self._get_neat_date(now)
-        loc = site_str.find(neat_today_date + " - ")
-
-        # if we can't find today's theme, return a blank string
-        if loc == -1:
-            return ''
-            # FIND YESTERDAY'S THEME:
-            # yesterday = datetime.now() - timedelta(days=1)
-            # neat_today_date = self._get_neat_date(yesterday)
-            # loc = site_str.find(neat_today_date + " - ")
-
-        site_str = site_str[loc:]
-        site_str = site_str[:site_str.find('"')]
-        if len(site_str) > 100:
-            site_str = site_str[:100]
-
-        return site_str
+        return await self._fetcher.fetch(self._get_neat_date(datetime.now()))
 
     @tasks.loop(minutes=30)
     async def _get_sketch_prompt(self):
@@ -531,7 +869,13 @@ class AutoDrawingPromptCog(ConfiguredCog):
         wasn't found, nothing is announced in the channel.
         """
 
-        drawing_prompt = self._get_daily_drawing_prompt()
+        today = datetime.now().date().isoformat()
+        if self.current_prompt_date == today:
+            # Today's prompt was already posted (possibly before a restart),
+            # so there's no need to look for it again
+            return
+
+        drawing_prompt = await self._get_daily_drawing_prompt()
 
         if drawing_prompt == '':
             # No drawing prompt found for today; don't do anything
@@ -542,26 +886,55 @@ class AutoDrawingPromptCog(ConfiguredCog):
 
         # The prompt we pulled does not match what we found before,
         # so post the new text.
-        channel_name = ConfiguredCog.config['content']['daily_prompt_channel']
-        for channel in self.bot.get_all_channels():
-            if (channel.name == channel_name and
-                    isinstance(channel, TextChannel)):
-                # Build the prompt message
-                color = ConfiguredCog.config['content']['prompt_color']
-                color = ConfiguredCog.convert_color(color)
-                title = 'Prompt for today, courtesy of r/SketchDaily'
-                url = 'https://reddit.com/r/SketchDaily'
-                description = drawing_prompt
-                message = Embed(color=color,
-                                title=title,
-                                url=url,
-                                description=description)
-
-                # Send the message
-                await channel.send(embed=message)
-
-                # Note down that we found today's prompt
-                # (so as not to re-send it)
-                self.current_prompt = drawing_prompt
-
-                break
+        channel = self._find_prompt_channel()
+        if channel is None:
+            # Nowhere to post it; try again next time
+            return
+
+        # Build the prompt message
+        title = 'Prompt for today, courtesy of r/SketchDaily'
+        url = 'https://reddit.com/r/SketchDaily'
+        description = drawing_prompt
+        message = Embed(color=self._prompt_color,
+                        title=title,
+                        url=url,
+                        description=description)
+
+        # Send the message
+        await channel.send(embed=message)
+
+        # Note down that we found today's prompt
+        # (so as not to re-send it, even after a restart)
+        self.current_prompt = drawing_prompt
+        self.current_prompt_date = today
+        self._save_prompt_state()
+
+    def _find_prompt_channel(self) -> Optional[TextChannel]:
+        """Finds the text channel the prompt is posted to, only searching the
+        bot's channels when it isn't already known.
+
+        :return:    The first text channel with the configured name, or None
+                    if there isn't one.
+        """
+
+        if self._prompt_channel is None:
+            self._prompt_channel = utils.find(
+                lambda channel: (channel.name == self._prompt_channel_name and
+                                 isinstance(channel, TextChannel)),
+                self.bot.get_all_channels())
+
+        return self._prompt_channel
+
+    @commands.Cog.listener('on_guild_channel_create')
+    @commands.Cog.listener('on_guild_channel_delete')
+    @commands.Cog.listener('on_guild_channel_update')
+    @commands.Cog.listener('on_guild_join')
+    @commands.Cog.listener('on_guild_remove')
+    async def _forget_prompt_channel(self, *_args):
+        """Forgets the prompt channel when channels or guilds come, go or
+        change, so that it's searched for again on the next post.
+
+        :param _args:   The event's arguments, which aren't needed.
+        """
+
+        self._prompt_channel = None
@@ -1,9 +1,9 @@
 """A module containing tools that a discord user might need."""
 from enum import Enum
-from typing import Union
+from typing import Optional, Union
 
 from discord.ext import commands
-from discord import Role, Embed
+from discord import Guild, Role, Embed
 
 from src.cogs.base import ConfiguredCog
 
@@ -23,6 +23,22 @@ class RoleRequestCog(ConfiguredCog):
 
     config_name = 'role'
 
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog and its role whitelist.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The roles that may be requested, in their configured order for
+        # listing and as a set for checking; the config is only loaded once
+        self._role_whitelist_order: tuple = tuple(
+            self.config['content']['role_whitelist'])
+        self._role_whitelist: frozenset = frozenset(
+            self._role_whitelist_order)
+
     @commands.command()
     async def role(self,
                    ctx: commands.Context,
@@ -70,17 +86,12 @@ class RoleRequestCog(ConfiguredCog):
 
         :return:    The resulting message to send back to the user.
         """
-        # find role
-        role = self.find_role_in_guild(role_query, ctx.guild)
-        if not role:
-            return (f'No role by the name of `{role_query}` exists in this '
-                    f'guild. Please check your spelling and try again.')
+        role, error_message = self._find_requestable_role(role_query,
+                                                          ctx.guild)
+        if role is None:
+            return error_message
 
-        # make sure it's allowed to be manipulated
-        if not self._validate_role_against_whitelist(role):
-            return 'You are not allowed to interact with this role.'
-
-        if self.member_contains_role(role.name, ctx.author):
+        if self.member_contains_role(role, ctx.author):
             return 'You already have that role.'
 
         # add role to user
@@ -97,17 +108,12 @@ class RoleRequestCog(ConfiguredCog):
         :param role_query:  The role query the user inputted.
         :return:    The resulting message to send back to the user.
         """
-        # find role
-        role = self.find_role_in_guild(role_query, ctx.guild)
-        if not role:
-            return (f'No role by the name of `{role_query}` exists in this '
-                    f'guild. Please check your spelling and try again.')
+        role, error_message = self._find_requestable_role(role_query,
+                                                          ctx.guild)
+        if role is None:
+            return error_message
 
-        # make sure it's allowed to be manipulated
-        if not self._validate_role_against_whitelist(role):
-            return 'You are not allowed to interact with this role.'
-
-        if not self.member_contains_role(role.name, ctx.author):
+        if not self.member_contains_role(role, ctx.author):
             return 'You do not have that role.'
 
         # remove role from user
@@ -115,6 +121,32 @@ class RoleRequestCog(ConfiguredCog):
         await ctx.author.remove_roles(role, reason=reason)
         return f'You no longer have the `{role.name}` role.'
 
+    def _find_requestable_role(self,
+                               role_query: str,
+                               guild: Guild) -> tuple[Optional[Role],
+                                                      Optional[str]]:
+        """Finds the role requested in the guild, if it may be added or
+        removed through the `role` command.
+
+        :param role_query:  The role query the user inputted.
+        :param guild:       The guild to find the role in.
+
+        :return:    A tuple of the role and None, or of None and the message to
+                    send back to the user if the role can't be used.
+        """
+        # find role
+        role = self.find_role_in_guild(role_query, guild)
+        if not role:
+            return None, (f'No role by the name of `{role_query}` exists in '
+                          f'this guild. Please check your spelling and try '
+                          f'again.')
+
+        # make sure it's allowed to be manipulated
+        if not self._validate_role_against_whitelist(role):
+            return None, 'You are not allowed to interact with this role.'
+
+        return role, None
+
     def _build_role_list_message(self, ctx: commands.Context) -> str:
         """ Builds a human-readable list of all the roles available to
         manipulate with the `role` command.
@@ -122,12 +154,15 @@ class RoleRequestCog(ConfiguredCog):
         :param ctx: The command context.
         :return:    A human-readable message listing the roles available.
         """
-        message = '__**Available roles to add/remove:**__'
-        for role_name in self.config['content']['role_whitelist']:
-            if self.find_role_in_guild(role_name, ctx.guild):
-                message += f'\n{role_name}'
+        # Gather the guild's role names in one pass, rather than looking each
+        # whitelisted role up on its own
+        guild_role_names = {role.name for role in ctx.guild.roles}
+        available_roles = [role_name
+                           for role_name in self._role_whitelist_order
+                           if role_name in guild_role_names]
 
-        return message
+        return '\n'.join(['__**Available roles to add/remove:**__',
+                          *available_roles])
 
     def _validate_role_against_whitelist(self, role: Role) -> bool:
         """Validates that the given role is in the config whitelist for allowed
@@ -140,9 +175,28 @@ class RoleRequestCog(ConfiguredCog):
                     config, False otherwise.
         """
         # Check the whitelist to make sure we are allowed to add this role
-        if role.name not in self.config["content"]["role_whitelist"]:
-            return False
-        return True
+        return role.name in self._role_whitelist
+
+    @commands.Cog.listener('on_guild_role_create')
+    @commands.Cog.listener('on_guild_role_delete')
+    async def _on_guild_role_change(self, role: Role):
+        """Drops the guild's role name lookup when a role is added or removed,
+        as it may change which role a name finds.
+
+        :param role:    The role that was created or deleted.
+        """
+        self.invalidate_role_index(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: Role, after: Role):
+        """Drops the guild's role name lookup when a role is renamed or moved,
+        as it may change which role a name finds.
+
+        :param before:  The role before the update.
+        :param after:   The role after the update.
+        """
+        if before.name != after.name or before.position != after.position:
+            self.invalidate_role_index(after.guild)
 
 
 class TagCog(ConfiguredCog):
@@ -150,6 +204,18 @@ class TagCog(ConfiguredCog):
 
     config_name = 'tag'
 
+    def __init__(self, bot: commands.Bot):
+        """Initializes the cog and its tags.
+
+        :param bot: A discord bot instance which will be saved within the class
+                    instance.
+        """
+
+        super().__init__(bot)
+
+        # The config is only loaded once, so hold onto the tags directly
+        self._tags: dict = self.config['content']['tags']
+
     @commands.command()
     async def tag(self,
                   ctx: commands.Context,
@@ -161,14 +227,17 @@ class TagCog(ConfiguredCog):
         """
 
         if tag_name is not None:
-            tag_data = None
-            tag_list = ConfiguredCog.config['content']['tags']
-            for tag in tag_list:
-                # Check the tag, agnostic of case.
-                if tag.lower() == tag_name.lower():
-                    tag_name = tag
-                    tag_data = tag_list[tag_name]
-                    break
+            tag_list = self._tags
+            # Try the tag exactly as given first, as it's a single lookup
+            tag_data = tag_list.get(tag_name)
+            if tag_data is None:
+                tag_query = tag_name.lower()
+                for tag, data in tag_list.items():
+                    # Check the tag, agnostic of case.
+                    if tag.lower() == tag_query:
+                        tag_name = tag
+                        tag_data = data
+                        break
 
             # Throw an error since we didn't find a tag
             if tag_data is None:
@@ -176,16 +245,16 @@ class TagCog(ConfiguredCog):
                 return
 
             # Build tag data
-            tag_color = self._get_tag_data_safe(tag_data, 'color')
+            tag_color = tag_data.get('color')
             color = ConfiguredCog.convert_color(tag_color)
 
-            title = self._get_tag_data_safe(tag_data, 'title')
+            title = tag_data.get('title')
             if title is None:
                 # Tag title isn't set, but is required, set it to the tag name
                 title = tag_name
 
-            url = self._get_tag_data_safe(tag_data, 'url')
-            description = self._get_tag_data_safe(tag_data, 'description')
+            url = tag_data.get('url')
+            description = tag_data.get('description')
 
             # Send embed
             message = Embed(color=color,
@@ -198,9 +267,9 @@ class TagCog(ConfiguredCog):
                            'to display the tag contents.')
             message = Embed(title='Available Tags',
                             description=description)
-            tag_list = ConfiguredCog.config['content']['tags']
-            for tag_id in tag_list.keys():
-                title = self._get_tag_data_safe(tag_list[tag_id], 'title')
+            tag_list = self._tags
+            for tag_id, tag_data in tag_list.items():
+                title = tag_data.get('title')
                 if title is None:
                     # Tag title isn't set, but is required,
                     # so set it to the tag name
@@ -209,25 +278,3 @@ class TagCog(ConfiguredCog):
                 message.add_field(name=tag_id, value=title)
 
         await ctx.send(embed=message)
-
-    @staticmethod
-    def _get_tag_data_safe(tag_data: dict[str, str],
-                           tag_name: str) -> Union[str, None]:
-        """Looks up the tag name from a dictionary of tag data and fail safely
-        if it can't be found.
-
-        :param tag_data:    A dictionary of tags and their data, where the keys
-                            are strings referencing the tag's name,
-                            and the values are dictionaries denoting the data
-                            to build the tag.
-        :param tag_name:    The key to query in the provided data.
-
-        :return:    If the tag name is found in the data's keys, return the
-                    corresponding dictionary value. If the tag's name was not
-                    found in the data's keys, return `None`.
-        """
-
-        try:
-            return tag_data[tag_name]
-        except KeyError:
-            return None
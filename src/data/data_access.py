@@ -3,6 +3,8 @@
 from datetime import datetime
 from typing import Union
 
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.orm.query import Query
 
@@ -52,6 +54,8 @@ class DatabaseMethod(Decorator):
     method is called.
     """
 
+    __slots__ = ()
+
     # A Session class object that can be used for session initialization of a session.
     session: Session = SessionObject()
 
@@ -134,6 +138,25 @@ def find_user_id_by_discord_id(discord_id: int, **kwargs) -> int:
     return user_row.User_Id
 
 
+@DatabaseMethod
+def ensure_users(discord_ids: list, **kwargs):
+    """Makes sure the users are in the database, adding any that aren't, in a
+    single statement.
+
+    :param discord_ids: The unique discord ids of the users.
+    :param kwargs:      Keyword arguments for the method, must include a
+                        `session` argument.
+    """
+
+    session = _get_session(kwargs)
+
+    session.execute(sqlite_insert(UserTable)
+                    .values([{'Discord_Id': discord_id}
+                             for discord_id in discord_ids])
+                    .on_conflict_do_nothing(
+                        index_elements=[UserTable.Discord_Id]))
+
+
 @DatabaseMethod
 def add_user(discord_id: int, **kwargs) -> int:
     """Adds a user to the database.
@@ -182,6 +205,54 @@ def lookup_warnings_by_discord_id(discord_id: int, **kwargs) -> Query:
     return warning_rows
 
 
+@DatabaseMethod
+def count_warnings_by_discord_id(discord_id: int, **kwargs) -> int:
+    """Counts the warnings for the given discord id with a single query.
+
+    :param discord_id:  The unique discord id to look for in the database.
+    :param kwargs:      Keyword arguments for the method, must include a
+                        `session` argument.
+
+    :return:    The number of warnings the user has, or zero if they aren't
+                in the database.
+    """
+
+    session = _get_session(kwargs)
+
+    warning_count = (session.query(func.count(WarningTable.Warning_Id))
+                     .select_from(UserTable)
+                     .join(UserTable.Warnings)
+                     .filter(UserTable.Discord_Id == discord_id)
+                     .scalar())
+
+    return warning_count
+
+
+@DatabaseMethod
+def count_warnings_by_discord_ids(discord_ids: list, **kwargs) -> dict:
+    """Counts the warnings for each of the given discord ids with a single
+    query.
+
+    :param discord_ids: The unique discord ids to look for in the database.
+    :param kwargs:      Keyword arguments for the method, must include a
+                        `session` argument.
+
+    :return:    A dictionary where the key is the discord ID and the value is
+                the number of warnings the user has. Users without any
+                warnings (or who aren't in the database) are left out.
+    """
+
+    session = _get_session(kwargs)
+
+    warning_counts = (session.query(UserTable.Discord_Id,
+                                    func.count(WarningTable.Warning_Id))
+                      .join(UserTable.Warnings)
+                      .filter(UserTable.Discord_Id.in_(discord_ids))
+                      .group_by(UserTable.Discord_Id))
+
+    return dict(warning_counts.all())
+
+
 @DatabaseMethod
 def lookup_warning_by_warning_id(warning_id: int,
                                  **kwargs) -> Union[Query, None]:
@@ -228,11 +299,62 @@ def add_warning(user_id: int, **kwargs) -> int:
         order_by(WarningTable.Warning_Stamp.desc()).first().Warning_Id
 
 
+@DatabaseMethod
+def add_warning_by_discord_id(discord_id: int, **kwargs) -> int:
+    """Adds a warning to the specified discord member, adding the member to
+    the database first if they aren't in it yet.
+
+    :param discord_id:  The unique Discord ID of the user to add a warning to.
+    :param kwargs:      Keyword arguments for the method, must include a
+                        `session` argument.
+
+    :return:    The number of warnings the user has, including the new one.
+    """
+
+    session = _get_session(kwargs)
+
+    return add_warnings_by_discord_ids([discord_id],
+                                       session=session)[discord_id]
+
+
+@DatabaseMethod
+def add_warnings_by_discord_ids(discord_ids: list, **kwargs) -> dict:
+    """Adds a warning to each of the specified discord members, adding any
+    members to the database first that aren't in it yet.
+
+    :param discord_ids: The unique Discord IDs of the users to add a warning
+                        to. Each user only gets one warning, even if their ID
+                        is listed more than once.
+    :param kwargs:      Keyword arguments for the method, must include a
+                        `session` argument.
+
+    :return:    A dictionary where the key is the discord ID and the value is
+                the number of warnings the user has, including the new one.
+    """
+
+    session = _get_session(kwargs)
+
+    ensure_users(discord_ids, session=session)
+
+    # Attach the warnings to the users' rows directly, rather than reading
+    # the user ids back out first
+    session.execute(insert(WarningTable).from_select(
+        ['User_Id', 'Warning_Stamp'],
+        select(UserTable.User_Id,
+               literal(datetime.now(), WarningTable.Warning_Stamp.type))
+        .where(UserTable.Discord_Id.in_(discord_ids))))
+
+    return count_warnings_by_discord_ids(discord_ids, session=session)
+
+
 @DatabaseMethod
 def delete_warning_by_discord_id(discord_id: int,
                                  remove_newest: bool = False,
-                                 **kwargs):
-    """Deletes a warning from the specified discord member.
+                                 **kwargs) -> int:
+    """Deletes a warning from the specified discord member, if they have any.
+
+    The warning is picked and deleted by a single statement, rather than being
+    loaded first.
 
     :param discord_id:      The unique Discord ID of the user to delete a
                             warning from.
@@ -240,19 +362,50 @@ def delete_warning_by_discord_id(discord_id: int,
                             rather than the oldest (defaults to False).
     :param kwargs:          Keyword arguments for the method, must include a
                             `session` argument.
+
+    :return:    The number of warnings the user has left.
     """
 
     session = _get_session(kwargs)
 
-    warning_list = lookup_warnings_by_discord_id(discord_id, session=session)
-
     if remove_newest:
-        warning_to_remove = warning_list.order_by(WarningTable.Warning_Stamp.desc()).first()
+        stamp_order = WarningTable.Warning_Stamp.desc()
     else:
-        warning_to_remove = warning_list.order_by(WarningTable.Warning_Stamp.asc()).first()
+        stamp_order = WarningTable.Warning_Stamp.asc()
 
-    if warning_to_remove is not None:
-        session.delete(warning_to_remove)
+    user_id = (session.query(UserTable.User_Id)
+               .filter(UserTable.Discord_Id == discord_id)
+               .scalar_subquery())
+    warning_id = (session.query(WarningTable.Warning_Id)
+                  .filter(WarningTable.User_Id == user_id)
+                  .order_by(stamp_order)
+                  .limit(1)
+                  .scalar_subquery())
+
+    (session.query(WarningTable)
+     .filter(WarningTable.Warning_Id == warning_id)
+     .delete(synchronize_session=False))
+
+    return count_warnings_by_discord_id(discord_id, session=session)
+
+
+@DatabaseMethod
+def delete_warnings_older_than(cutoff: datetime, **kwargs) -> int:
+    """Deletes all the warnings that were given before the cutoff, across all
+    users, in a single statement.
+
+    :param cutoff:  The time before which warnings should be deleted.
+    :param kwargs:  Keyword arguments for the method, must include a
+                    `session` argument.
+
+    :return:    The number of warnings deleted.
+    """
+
+    session = _get_session(kwargs)
+
+    return (session.query(WarningTable)
+            .filter(WarningTable.Warning_Stamp < cutoff)
+            .delete(synchronize_session=False))
 
 
 @DatabaseMethod
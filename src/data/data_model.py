@@ -1,6 +1,7 @@
 """The data model for the database used by manageable."""
 
-from sqlalchemy import create_engine, Column, Integer, ForeignKey, DateTime
+from sqlalchemy import (create_engine, Column, Integer, ForeignKey, DateTime,
+                        Index)
 from sqlalchemy.orm import relationship, DeclarativeBase
 
 engine = create_engine('sqlite:///data/database.db')
@@ -38,6 +39,12 @@ class WarningTable(_Base):
     Warning_Stamp = Column('Warning_Stamp', DateTime, nullable=False)
     User = relationship('UserTable', back_populates='Warnings')
 
+    # Warnings are looked up by user and picked or expired by age, so index
+    # them in that order
+    __table_args__ = (Index('idx_warnings_user_stamp',
+                            'User_Id',
+                            'Warning_Stamp'),)
+
 
 # pylint: disable-msg=R0903
 class CookieTable(_Base):
@@ -54,3 +61,8 @@ class CookieTable(_Base):
 
 
 _Base.metadata.create_all(engine)
+
+# create_all skips tables that already exist, so add any indexes that were
+# introduced after the database was first created
+for _index in WarningTable.__table__.indexes:
+    _index.create(engine, checkfirst=True)